@@ -1,9 +1,9 @@
 import json
+import time
 from typing import Any, Dict, Optional
 from urllib.parse import quote_plus
 
 import jwt
-import requests
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
 from flask import Request, abort, current_app, g, redirect, session, url_for
 from flask.typing import ResponseReturnValue
@@ -11,6 +11,15 @@ from sentry_sdk import set_user
 
 from api.extensions import oidc
 from api.models import OktaUser
+from api.services.http_session import HTTP_REQUEST_TIMEOUT, create_http_session
+
+CLOUDFLARE_REQUEST_MAX_RETRIES = 3
+
+# Reuse a single session for fetching Cloudflare Access certs so the TCP and TLS
+# connection to the team domain is kept alive between key set refreshes
+_cloudflare_session = create_http_session(
+    headers={"Accept": "application/json"}, max_retries=CLOUDFLARE_REQUEST_MAX_RETRIES
+)
 
 
 class AuthenticationHelpers:
@@ -85,13 +94,23 @@ class CloudflareAuthenticationHelpers:
         keys = current_app.config["CLOUDFLARE_PUBLIC_KEYS"]
 
         if unverified_payload["kid"] not in keys:
-            # If the kid is not in the cache, fetch the new key set
-            keys = CloudflareAuthenticationHelpers.get_public_keys(current_app.config["CLOUDFLARE_TEAM_DOMAIN"])
-            if unverified_payload["kid"] not in keys:
+            # Don't refetch the key set for every token with an unknown kid if it was just refetched
+            # for another unknown kid. The initial fetch at startup doesn't count, so a key rotated in
+            # right after startup is still picked up
+            refetched_at = current_app.config.get("CLOUDFLARE_PUBLIC_KEYS_REFETCHED_AT")
+            if (
+                refetched_at is not None
+                and time.monotonic() - refetched_at < current_app.config["CLOUDFLARE_PUBLIC_KEYS_MIN_REFRESH_SECONDS"]
+            ):
                 abort(403, "Invalid Cloudflare authorization token: Invalid kid")
 
-            # Cache the new key set
+            # If the kid is not in the cache, fetch and cache the new key set. Cache it even if the kid
+            # isn't in it, so that tokens signed with rotated keys are accepted until the next refetch
+            keys = CloudflareAuthenticationHelpers.get_public_keys(current_app.config["CLOUDFLARE_TEAM_DOMAIN"])
             current_app.config["CLOUDFLARE_PUBLIC_KEYS"] = keys
+            current_app.config["CLOUDFLARE_PUBLIC_KEYS_REFETCHED_AT"] = time.monotonic()
+            if unverified_payload["kid"] not in keys:
+                abort(403, "Invalid Cloudflare authorization token: Invalid kid")
 
         payload = {}
         try:
@@ -113,7 +132,9 @@ class CloudflareAuthenticationHelpers:
         Returns:
             List of RSA public keys usable by PyJWT.
         """
-        r = requests.get("https://{}/cdn-cgi/access/certs".format(cloudflare_team_domain))
+        r = _cloudflare_session.get(
+            "https://{}/cdn-cgi/access/certs".format(cloudflare_team_domain), timeout=HTTP_REQUEST_TIMEOUT
+        )
         public_keys = {}
         jwk_set = r.json()
         for key_dict in jwk_set["keys"]:
@@ -99,19 +99,13 @@ class AuthorizationHelpers:
     # Check if the current user is a owner of the group
     @staticmethod
     def is_group_owner(group: OktaGroup) -> bool:
-        return (
+        return db.session.query(
             OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id == group.id)
             .filter(OktaUserGroupMember.user_id == g.current_user_id)
             .filter(OktaUserGroupMember.is_owner.is_(True))
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
-            .count()
-            > 0
-        )
+            .filter(OktaUserGroupMember.active_filter())
+            .exists()
+        ).scalar()
 
     # If this is an app group, check if the current user is a owner of the app owner group
     @staticmethod
@@ -123,28 +117,24 @@ class AuthorizationHelpers:
         else:
             return False
 
-        owner_app_groups = (
-            AppGroup.query.filter(OktaGroup.deleted_at.is_(None))
+        owner_app_group_ids = [
+            ag.id
+            for ag in AppGroup.query.with_entities(AppGroup.id)
+            .filter(OktaGroup.deleted_at.is_(None))
             .filter(AppGroup.app_id == app_id)
             .filter(AppGroup.is_owner.is_(True))
-        )
-        if owner_app_groups.count() == 0:
+        ]
+        if len(owner_app_group_ids) == 0:
             return False
 
         # Allow only app owner group owners to manage an app
-        return (
-            OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id.in_([ag.id for ag in owner_app_groups]))
+        return db.session.query(
+            OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id.in_(owner_app_group_ids))
             .filter(OktaUserGroupMember.user_id == g.current_user_id)
             .filter(OktaUserGroupMember.is_owner.is_(True))
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
-            .count()
-            > 0
-        )
+            .filter(OktaUserGroupMember.active_filter())
+            .exists()
+        ).scalar()
 
     # Check to see if they are an Access app owner group member (aka. Access admin)
     @staticmethod
@@ -164,21 +154,15 @@ class AuthorizationHelpers:
         if len(access_app.active_owner_app_groups) == 0:
             return False
 
-        return (
+        return db.session.query(
             OktaUserGroupMember.query.filter(
                 OktaUserGroupMember.group_id.in_([ag.id for ag in access_app.active_owner_app_groups])
             )
             .filter(OktaUserGroupMember.user_id == current_user_id)
             .filter(OktaUserGroupMember.is_owner.is_(False))
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
-            .count()
-            > 0
-        )
+            .filter(OktaUserGroupMember.active_filter())
+            .exists()
+        ).scalar()
 
     # Combination of all the above helper methods
     @staticmethod
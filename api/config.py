@@ -40,6 +40,8 @@ if os.getenv("CLOUDFLARE_APPLICATION_AUDIENCE") is not None:
 # Your Cloudflare Access team domain
 if os.getenv("CLOUDFLARE_TEAM_DOMAIN") is not None:
     CLOUDFLARE_TEAM_DOMAIN = os.getenv("CLOUDFLARE_TEAM_DOMAIN")
+# Minimum number of seconds between refetches of the Cloudflare Access key set on an unknown kid
+CLOUDFLARE_PUBLIC_KEYS_MIN_REFRESH_SECONDS = int(os.getenv("CLOUDFLARE_PUBLIC_KEYS_MIN_REFRESH_SECONDS", "60"))
 
 # OIDC authentication
 # Specify an OIDC client secret json blob or path to a json file
@@ -1,3 +1,4 @@
+import threading
 from typing import Callable, Optional, ParamSpec, Tuple
 
 from flask import jsonify
@@ -59,16 +60,26 @@ def get_cloudsql_conn(
     db_name: Optional[str] = "access",
     uses_public_ip: Optional[bool] = False,
 ) -> Callable[[], Connector]:
+    # Share a single connector across all pool connections so its background refresh of the
+    # instance metadata and ephemeral certificate is reused, instead of redone for every connection
+    connector: Optional[Connector] = None
+    # The connection pool calls the creator outside of its own lock, so guard creating the shared
+    # connector to keep concurrent first connections from each creating (and leaking) one
+    connector_lock = threading.Lock()
+
     def _get_conn() -> Connector:
-        with Connector() as connector:
-            conn = connector.connect(
-                cloudsql_connection_name,  # Cloud SQL Instance Connection Name
-                "pg8000",
-                user=db_user,
-                db=db_name,
-                ip_type=IPTypes.PUBLIC if uses_public_ip else IPTypes.PRIVATE,
-                enable_iam_auth=True,
-            )
-            return conn
+        nonlocal connector
+        with connector_lock:
+            if connector is None:
+                connector = Connector()
+        conn = connector.connect(
+            cloudsql_connection_name,  # Cloud SQL Instance Connection Name
+            "pg8000",
+            user=db_user,
+            db=db_name,
+            ip_type=IPTypes.PUBLIC if uses_public_ip else IPTypes.PRIVATE,
+            enable_iam_auth=True,
+        )
+        return conn
 
     return _get_conn
@@ -26,30 +26,24 @@ def verify_and_fix_role_memberships(dry_run: bool = False) -> None:
     for active_role_group_map in active_role_group_maps:
         active_role_group_members_query = (
             OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id == active_role_group_map.role_group_id)
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
+            .filter(OktaUserGroupMember.active_filter())
             .filter(OktaUserGroupMember.is_owner.is_(False))
         )
-        active_role_group_members_ids = [m.user_id for m in active_role_group_members_query.all()]
+        # Index the role group memberships by user, to look up their end dates below without a query per user
+        active_role_group_members_by_user_id: dict[str, OktaUserGroupMember] = {}
+        for m in active_role_group_members_query.all():
+            active_role_group_members_by_user_id.setdefault(m.user_id, m)
+        active_role_group_members_ids = list(active_role_group_members_by_user_id.keys())
 
         active_group_users_for_role = (
-            OktaUserGroupMember.query.filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
+            OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
             .filter(OktaUserGroupMember.role_group_map_id == active_role_group_map.id)
             .all()
         )
-        active_group_users_for_role_ids = [m.user_id for m in active_group_users_for_role]
+        active_group_users_for_role_ids = {m.user_id for m in active_group_users_for_role}
 
         # Fix missing group memberships/ownerships for the role by adding the user to the group
-        missing_group_users_for_role = set(active_role_group_members_ids) - set(active_group_users_for_role_ids)
+        missing_group_users_for_role = set(active_role_group_members_ids) - active_group_users_for_role_ids
         if len(missing_group_users_for_role) > 0:
             logger.info(
                 f"Role {active_role_group_map.role_group_id} is missing group "
@@ -58,9 +52,7 @@ def verify_and_fix_role_memberships(dry_run: bool = False) -> None:
             )
             if not dry_run:
                 for member in list(missing_group_users_for_role):
-                    role_group_membership = active_role_group_members_query.filter(
-                        OktaUserGroupMember.user_id == member
-                    ).first()
+                    role_group_membership = active_role_group_members_by_user_id[member]
                     if not active_role_group_map.is_owner:
                         # Add user to okta group members
                         okta.add_user_to_group(
@@ -95,7 +87,7 @@ def verify_and_fix_role_memberships(dry_run: bool = False) -> None:
 
         # Fix extra group memberships/ownerships for the role by ending the membership and potentially
         # removing the user from the group
-        extra_group_users_for_role = set(active_group_users_for_role_ids) - set(active_role_group_members_ids)
+        extra_group_users_for_role = active_group_users_for_role_ids - set(active_role_group_members_ids)
         if len(extra_group_users_for_role) > 0:
             logger.info(
                 f"Role {active_role_group_map.role_group_id} has extra "
@@ -104,14 +96,9 @@ def verify_and_fix_role_memberships(dry_run: bool = False) -> None:
             )
             if not dry_run:
                 # End all extra OktaUserGroupMembers the users not members of the role group
-                OktaUserGroupMember.query.filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                ).filter(OktaUserGroupMember.role_group_map_id == active_role_group_map.id).filter(
-                    OktaUserGroupMember.user_id.in_(extra_group_users_for_role)
-                ).update(
+                OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter()).filter(
+                    OktaUserGroupMember.role_group_map_id == active_role_group_map.id
+                ).filter(OktaUserGroupMember.user_id.in_(extra_group_users_for_role)).update(
                     {OktaUserGroupMember.ended_at: db.func.now()},
                     synchronize_session="fetch",
                 )
@@ -121,19 +108,14 @@ def verify_and_fix_role_memberships(dry_run: bool = False) -> None:
                 # combination before removing membership, there can be multiple role groups
                 # which allow group access for this user
                 removed_users_with_other_access = (
-                    OktaUserGroupMember.query.filter(
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        )
-                    )
+                    OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
                     .filter(OktaUserGroupMember.is_owner == active_role_group_map.is_owner)
                     .filter(OktaUserGroupMember.group_id == active_role_group_map.group_id)
                     .filter(OktaUserGroupMember.user_id.in_(extra_group_users_for_role))
                     .all()
                 )
-                removed_users_with_other_access_ids = [m.user_id for m in removed_users_with_other_access]
-                okta_users_to_remove_ids = set(extra_group_users_for_role) - set(removed_users_with_other_access_ids)
+                removed_users_with_other_access_ids = {m.user_id for m in removed_users_with_other_access}
+                okta_users_to_remove_ids = set(extra_group_users_for_role) - removed_users_with_other_access_ids
                 for user_id in okta_users_to_remove_ids:
                     if not active_role_group_map.is_owner:
                         # Remove user from okta group membership
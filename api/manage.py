@@ -126,6 +126,7 @@ def sync(sync_groups_authoritatively: bool, sync_group_memberships_authoritative
     from sentry_sdk import start_transaction
     from flask import current_app
 
+    from api.services import okta
     from api.syncer import (
         expire_access_requests,
         sync_group_memberships,
@@ -136,10 +137,28 @@ def sync(sync_groups_authoritatively: bool, sync_group_memberships_authoritative
 
     with start_transaction(op="sync"):
         sync_users()
-        sync_groups(act_as_authority=sync_groups_authoritatively)
-        sync_group_memberships(act_as_authority=sync_group_memberships_authoritatively)
+
+        # Fetch the group rules once for all the syncs below, as group syncing doesn't change them
+        group_ids_with_group_rules = okta.list_groups_with_active_rules()
+        sync_groups(
+            act_as_authority=sync_groups_authoritatively,
+            group_ids_with_group_rules=group_ids_with_group_rules,
+        )
+
+        # Groups are only added or deleted in Okta by the group sync above,
+        # so list them once for both the membership and ownership syncs
+        groups = okta.list_groups()
+        sync_group_memberships(
+            act_as_authority=sync_group_memberships_authoritatively,
+            groups=groups,
+            group_ids_with_group_rules=group_ids_with_group_rules,
+        )
         if current_app.config["OKTA_USE_GROUP_OWNERS_API"]:
-            sync_group_ownerships(act_as_authority=sync_group_memberships_authoritatively)
+            sync_group_ownerships(
+                act_as_authority=sync_group_memberships_authoritatively,
+                groups=groups,
+                group_ids_with_group_rules=group_ids_with_group_rules,
+            )
         expire_access_requests()
 
 
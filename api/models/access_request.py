@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Set
 
 from api.models.app_group import get_access_owners, get_app_managers
@@ -18,4 +19,4 @@ def get_all_possible_request_approvers(access_request: AccessRequest) -> Set[Okt
     if type(access_request.requested_group) == AppGroup:
         app_managers = get_app_managers(access_request.requested_group.app_id)
 
-    return set(group_owners + access_app_owners + app_managers)
+    return set(chain(group_owners, access_app_owners, app_managers))
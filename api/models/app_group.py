@@ -1,6 +1,5 @@
 from typing import List
 
-from api.extensions import db
 from api.models.core_models import App, AppGroup, OktaGroup, OktaUser, OktaUserGroupMember
 
 
@@ -17,12 +16,7 @@ def get_app_managers(app_id: str) -> List[OktaUser]:
             OktaUser.query.join(OktaUser.all_group_memberships_and_ownerships)
             .filter(OktaUserGroupMember.group_id.in_([ag.id for ag in owner_app_groups]))
             .filter(OktaUserGroupMember.is_owner.is_(True))
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
+            .filter(OktaUserGroupMember.active_filter())
             .all()
         )
 
@@ -45,12 +39,7 @@ def get_access_owners() -> List[OktaUser]:
             OktaUser.query.join(OktaUser.all_group_memberships_and_ownerships)
             .filter(OktaUserGroupMember.group_id.in_([ag.id for ag in owner_app_groups]))
             .filter(OktaUserGroupMember.is_owner.is_(False))
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
+            .filter(OktaUserGroupMember.active_filter())
             .all()
         )
 
@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+from sqlalchemy import ColumnElement
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, validates
 from sqlalchemy.sql import expression
@@ -102,6 +103,11 @@ class OktaUserGroupMember(db.Model):
         "OktaUser", foreign_keys=[ended_actor_id], lazy="raise_on_sql", viewonly=True
     )
 
+    @classmethod
+    def active_filter(cls, at: Optional[datetime] = None) -> ColumnElement[bool]:
+        """Filter for group memberships and ownerships which have not ended by the given time, or now"""
+        return db.or_(cls.ended_at.is_(None), cls.ended_at > (at if at is not None else db.func.now()))
+
 
 class OktaUser(db.Model):
     id: Mapped[str] = mapped_column(db.Unicode(50), primary_key=True, nullable=False)
@@ -235,6 +241,13 @@ class OktaUser(db.Model):
         innerjoin=True,
     )
 
+    @classmethod
+    def get_active_user_id(cls, user_id: Optional[str]) -> Optional[str]:
+        """Returns the user id if it belongs to a user who has not been deleted, otherwise None"""
+        if user_id is None:
+            return None
+        return db.session.query(cls.id).filter(cls.deleted_at.is_(None)).filter(cls.id == user_id).scalar()
+
 
 class OktaGroup(db.Model):
     __tablename__ = "okta_group"
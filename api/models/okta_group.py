@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Iterable, List
 
 from api.extensions import db
 from api.models.core_models import OktaUser, OktaUserGroupMember
@@ -9,11 +9,25 @@ def get_group_managers(group_id: str) -> List[OktaUser]:
         OktaUser.query.join(OktaUserGroupMember, OktaUser.id == OktaUserGroupMember.user_id)
         .filter(OktaUserGroupMember.group_id == group_id)
         .filter(OktaUserGroupMember.is_owner.is_(True))
-        .filter(
-            db.or_(
-                OktaUserGroupMember.ended_at.is_(None),
-                OktaUserGroupMember.ended_at > db.func.now(),
-            )
-        )
+        .filter(OktaUserGroupMember.active_filter())
         .all()
     )
+
+
+def get_group_managers_by_group_id(group_ids: Iterable[str]) -> Dict[str, List[OktaUser]]:
+    """Returns the managers of each of the given groups using a single query"""
+    group_managers: Dict[str, Dict[str, OktaUser]] = {group_id: {} for group_id in group_ids}
+    if len(group_managers) == 0:
+        return {}
+
+    for group_id, user in (
+        db.session.query(OktaUserGroupMember.group_id, OktaUser)
+        .join(OktaUser, OktaUser.id == OktaUserGroupMember.user_id)
+        .filter(OktaUserGroupMember.group_id.in_(group_managers.keys()))
+        .filter(OktaUserGroupMember.is_owner.is_(True))
+        .filter(OktaUserGroupMember.active_filter())
+        .all()
+    ):
+        # A user may own a group both directly and via a role, only return them once
+        group_managers[group_id][user.id] = user
+    return {group_id: list(managers.values()) for group_id, managers in group_managers.items()}
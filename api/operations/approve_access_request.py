@@ -56,6 +56,19 @@ class ApproveAccessRequest:
         if self.access_request.requester_user_id == self.approver_id:
             return self.access_request
 
+        # Run the checks on the already loaded request and group first, so the requester
+        # and group tags are only queried for requests that could be approved
+        # Don't allow approving a request for a deleted or unmanaged group
+        if self.access_request.active_requested_group is None:
+            return self.access_request
+        if not self.access_request.active_requested_group.is_managed:
+            return self.access_request
+
+        # Don't allow approving a request if the requester is deleted
+        requester = db.session.get(OktaUser, self.access_request.requester_user_id)
+        if requester is None or requester.deleted_at is not None:
+            return self.access_request
+
         # Don't allow approving a request if the reason is invalid and required
         valid, _ = CheckForReason(
             group=self.access_request.requested_group,
@@ -66,17 +79,6 @@ class ApproveAccessRequest:
         if not valid:
             return self.access_request
 
-        # Don't allow approving a request if the requester is deleted
-        requester = db.session.get(OktaUser, self.access_request.requester_user_id)
-        if requester is None or requester.deleted_at is not None:
-            return self.access_request
-
-        # Don't allow approving a request for an a deleted or unmanaged group
-        if self.access_request.active_requested_group is None:
-            return self.access_request
-        if not self.access_request.active_requested_group.is_managed:
-            return self.access_request
-
         # Now handled inside ModifyGroupUsers
         # self.access_request.status = AccessRequestStatus.APPROVED
         # self.access_request.resolved_at = db.func.now()
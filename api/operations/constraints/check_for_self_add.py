@@ -51,13 +51,22 @@ class CheckForSelfAdd:
         self.owners_to_add = owners_to_add
 
     def execute_for_group(self) -> Tuple[bool, str]:
-        if self.current_user is None or AuthorizationHelpers.is_access_admin(self.current_user.id):
+        if self.current_user is None:
             return True, ""
 
-        if len(self.owners_to_add) > 0 and self.current_user.id in self.owners_to_add:
+        # Nothing to check unless the current user is adding themself, so skip the access admin lookup
+        if self.current_user.id not in self.members_to_add and self.current_user.id not in self.owners_to_add:
+            return True, ""
+
+        if AuthorizationHelpers.is_access_admin(self.current_user.id):
+            return True, ""
+
+        group_tags = [tag_map.active_tag for tag_map in self.group.active_group_tags]
+
+        if self.current_user.id in self.owners_to_add:
             disallow_self_add_ownership = coalesce_constraints(
                 constraint_key=Tag.DISALLOW_SELF_ADD_OWNERSHIP_CONSTRAINT_KEY,
-                tags=[tag_map.active_tag for tag_map in self.group.active_group_tags],
+                tags=group_tags,
             )
             if self.group.is_managed and disallow_self_add_ownership is True:
                 return (
@@ -65,10 +74,10 @@ class CheckForSelfAdd:
                     "Current user is an group owner who is restricted "
                     + f"from readding themself as owner to {self.group.name} due to group tags",
                 )
-        if len(self.members_to_add) > 0 and self.current_user.id in self.members_to_add:
+        if self.current_user.id in self.members_to_add:
             disallow_self_add_membership = coalesce_constraints(
                 constraint_key=Tag.DISALLOW_SELF_ADD_MEMBERSHIP_CONSTRAINT_KEY,
-                tags=[tag_map.active_tag for tag_map in self.group.active_group_tags],
+                tags=group_tags,
             )
             if self.group.is_managed and disallow_self_add_membership is True:
                 return (
@@ -109,27 +118,24 @@ class CheckForSelfAdd:
         return True, ""
 
     def execute_for_role(self) -> Tuple[bool, str]:
-        if self.current_user is None or AuthorizationHelpers.is_access_admin(self.current_user.id):
+        if self.current_user is None:
             return True, ""
 
-        if type(self.group) != RoleGroup:
+        if type(self.group) != RoleGroup or len(self.members_to_add) + len(self.owners_to_add) == 0:
+            return True, ""
+
+        if AuthorizationHelpers.is_access_admin(self.current_user.id):
             return True, ""
 
         # Check to see if the current user is a member of the role,
         # which would grant them access to the newly added groups associated with the role
-        if (
+        if db.session.query(
             OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id == self.group.id)
             .filter(OktaUserGroupMember.user_id == self.current_user.id)
             .filter(OktaUserGroupMember.is_owner.is_(False))
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
-            .count()
-            > 0
-        ):
+            .filter(OktaUserGroupMember.active_filter())
+            .exists()
+        ).scalar():
             if len(self.members_to_add) > 0:
                 new_member_groups = (
                     OktaGroup.query.options(
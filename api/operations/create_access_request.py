@@ -41,9 +41,10 @@ class CreateAccessRequest:
         else:
             self.requester = requester_user
 
+        # Only the group's own columns are read before the fully loaded group is fetched below
         self.requested_group = (
             db.session.query(OktaGroup)
-            .options(selectin_polymorphic(OktaGroup, [AppGroup, RoleGroup]), joinedload(AppGroup.app))
+            .options(selectin_polymorphic(OktaGroup, [AppGroup, RoleGroup]))
             .filter(OktaGroup.deleted_at.is_(None))
             .filter(OktaGroup.id == (requested_group if isinstance(requested_group, str) else requested_group.id))
             .first()
@@ -70,11 +70,7 @@ class CreateApp:
                 if name == self.owner_group_name:
                     continue
                 self.additional_app_groups.append(AppGroup(is_owner=False, name=name, description=description))
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self) -> App:
         # Do not allow non-deleted apps with the same name
@@ -26,11 +26,7 @@ class CreateGroup:
 
         self.tags = Tag.query.filter(Tag.deleted_at.is_(None)).filter(Tag.id.in_(tags)).all()
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self, *, _group: Optional[T] = None) -> T:
         # Do not allow non-deleted groups with the same name (case-insensitive)
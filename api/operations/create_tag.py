@@ -25,11 +25,7 @@ class CreateTag:
             tag.id = id
             self.tag = tag
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self) -> Tag:
         # Do not allow non-deleted groups with the same name (case-insensitive)
@@ -15,11 +15,7 @@ class DeleteApp:
         else:
             self.app = app
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self) -> None:
         # Prevent access app deletion
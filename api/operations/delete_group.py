@@ -33,11 +33,7 @@ class DeleteGroup:
 
         self.sync_to_okta = sync_to_okta
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self) -> None:
         # Run asychronously to parallelize Okta API requests
@@ -81,12 +77,9 @@ class DeleteGroup:
         self.group.deleted_at = db.func.now()
 
         # End all group members including group members via a role
-        group_memberships_query = OktaUserGroupMember.query.filter(
-            db.or_(
-                OktaUserGroupMember.ended_at.is_(None),
-                OktaUserGroupMember.ended_at > db.func.now(),
-            )
-        ).filter(OktaUserGroupMember.group_id == self.group.id)
+        group_memberships_query = OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter()).filter(
+            OktaUserGroupMember.group_id == self.group.id
+        )
 
         direct_members_to_remove_ids = [
             m.user_id
@@ -112,12 +105,7 @@ class DeleteGroup:
 
         if type(self.group) == RoleGroup:
             # End all group memberships via the role grant
-            OktaUserGroupMember.query.filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            ).filter(
+            OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter()).filter(
                 OktaUserGroupMember.role_group_map_id.in_(
                     db.session.query(RoleGroupMap.id)
                     .filter(
@@ -149,12 +137,7 @@ class DeleteGroup:
                         OktaUserGroupMember.group_id,
                         OktaUserGroupMember.is_owner,
                     )
-                    .filter(
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        )
-                    )
+                    .filter(OktaUserGroupMember.active_filter())
                     .filter(OktaUserGroupMember.user_id.in_(direct_members_to_remove_ids + direct_owners_to_remove_ids))
                     .filter(OktaUserGroupMember.group_id.in_([r.group_id for r in role_associated_groups_mappings]))
                     .group_by(
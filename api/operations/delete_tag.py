@@ -10,11 +10,7 @@ from api.views.schemas import AuditLogSchema, EventType
 class DeleteTag:
     def __init__(self, *, tag: Tag | str, current_user_id: Optional[str] = None):
         self.tag = Tag.query.filter(Tag.id == (tag if isinstance(tag, str) else tag.id)).first()
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self) -> None:
         # Audit logging
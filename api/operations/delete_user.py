@@ -1,10 +1,6 @@
 import asyncio
 from typing import Optional
 
-from sqlalchemy.orm import (
-    joinedload,
-)
-
 from api.extensions import db
 from api.models import AccessRequest, AccessRequestStatus, OktaGroup, OktaUser, OktaUserGroupMember
 from api.operations import RejectAccessRequest
@@ -20,11 +16,7 @@ class DeleteUser:
 
         self.sync_to_okta = sync_to_okta
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self) -> None:
         # Run asychronously to parallelize Okta API requests
@@ -38,35 +30,28 @@ class DeleteUser:
             self.user.deleted_at = db.func.now()
 
         # End all user memberships including group memberships via a role
-        group_access_query = OktaUserGroupMember.query.filter(
-            db.or_(
-                OktaUserGroupMember.ended_at.is_(None),
-                OktaUserGroupMember.ended_at > db.func.now(),
-            )
-        ).filter(OktaUserGroupMember.user_id == self.user.id)
+        group_access_query = OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter()).filter(
+            OktaUserGroupMember.user_id == self.user.id
+        )
 
         if self.sync_to_okta:
-            # Don't sync group access changes back to Okta for unmanaged groups
-            managed_group_access_query = (
-                group_access_query.options(joinedload(OktaUserGroupMember.group))
+            # Don't sync group access changes back to Okta for unmanaged groups. Only the distinct
+            # group ids are needed, as a user can have access to the same group via several roles.
+            # Memberships and ownerships are fetched together and split by is_owner below
+            managed_group_access = (
+                group_access_query.with_entities(OktaUserGroupMember.group_id, OktaUserGroupMember.is_owner)
                 .join(OktaUserGroupMember.group)
                 .filter(OktaGroup.is_managed.is_(True))
+                .distinct()
+                .all()
             )
-            # Remove user from group membership in Okta
-            group_memberships_to_remove_ids = [
-                m.group_id for m in managed_group_access_query.filter(OktaUserGroupMember.is_owner.is_(False)).all()
-            ]
-
-            for group_id in group_memberships_to_remove_ids:
-                okta_tasks.append(asyncio.create_task(okta.async_remove_user_from_group(group_id, self.user.id)))
-
-            # Remove user from group ownerships in Okta
-            group_ownerships_to_remove_ids = [
-                m.group_id for m in managed_group_access_query.filter(OktaUserGroupMember.is_owner.is_(True)).all()
-            ]
-
-            for group_id in group_ownerships_to_remove_ids:
-                okta_tasks.append(asyncio.create_task(okta.async_remove_owner_from_group(group_id, self.user.id)))
+            for m in managed_group_access:
+                if m.is_owner:
+                    # Remove user from group ownerships in Okta
+                    okta_tasks.append(asyncio.create_task(okta.async_remove_owner_from_group(m.group_id, self.user.id)))
+                else:
+                    # Remove user from group membership in Okta
+                    okta_tasks.append(asyncio.create_task(okta.async_remove_user_from_group(m.group_id, self.user.id)))
 
         group_access_query.update({OktaUserGroupMember.ended_at: db.func.now()}, synchronize_session="fetch")
 
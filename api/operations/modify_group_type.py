@@ -32,11 +32,7 @@ class ModifyGroupType:
         )
 
         self.group_changes = group_changes
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self) -> OktaGroup:
         # Update group type if it's being modified
@@ -99,12 +95,7 @@ class ModifyGroupType:
             if type(self.group_changes) == RoleGroup:
                 # Convert any group memberships and ownerships via a role to direct group memberships and ownerships
                 active_group_users_from_role = (
-                    OktaUserGroupMember.query.filter(
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        )
-                    )
+                    OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
                     .filter(OktaUserGroupMember.role_group_map_id.is_not(None))
                     .filter(OktaUserGroupMember.group_id == group_id)
                     .all()
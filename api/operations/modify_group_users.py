@@ -1,6 +1,7 @@
 import asyncio
+from collections import defaultdict
 from datetime import UTC, datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 from flask import current_app, has_request_context, request
 from sqlalchemy.orm import joinedload, selectin_polymorphic, selectinload
@@ -68,43 +69,35 @@ class ModifyGroupUsers:
             group_is_managed=self.group.is_managed,
         )
 
-        self.members_to_add = []
-        if len(members_to_add) > 0:
-            self.members_to_add = (
-                OktaUser.query.filter(OktaUser.id.in_(members_to_add)).filter(OktaUser.deleted_at.is_(None)).all()
-            )
-
-        self.owners_to_add = []
-        if len(owners_to_add) > 0:
-            self.owners_to_add = (
-                OktaUser.query.filter(OktaUser.id.in_(owners_to_add)).filter(OktaUser.deleted_at.is_(None)).all()
-            )
+        # Fetch all the active users being added or removed in one query, then split them up
+        user_ids = set(members_to_add) | set(owners_to_add) | set(members_to_remove) | set(owners_to_remove)
+        users = (
+            {
+                user.id: user
+                for user in OktaUser.query.filter(OktaUser.id.in_(user_ids)).filter(OktaUser.deleted_at.is_(None)).all()
+            }
+            if len(user_ids) > 0
+            else {}
+        )
 
-        self.members_to_remove = []
-        if len(members_to_remove) > 0:
-            self.members_to_remove = (
-                OktaUser.query.filter(OktaUser.id.in_(members_to_remove)).filter(OktaUser.deleted_at.is_(None)).all()
-            )
-
-        self.owners_to_remove = []
-        if len(owners_to_remove) > 0:
-            self.owners_to_remove = (
-                OktaUser.query.filter(OktaUser.id.in_(owners_to_remove)).filter(OktaUser.deleted_at.is_(None)).all()
-            )
+        self.members_to_add = [users[user_id] for user_id in dict.fromkeys(members_to_add) if user_id in users]
+        self.owners_to_add = [users[user_id] for user_id in dict.fromkeys(owners_to_add) if user_id in users]
+        self.members_to_remove = [users[user_id] for user_id in dict.fromkeys(members_to_remove) if user_id in users]
+        self.owners_to_remove = [users[user_id] for user_id in dict.fromkeys(owners_to_remove) if user_id in users]
 
         self.sync_to_okta = sync_to_okta
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
         self.created_reason = created_reason
         self.notify = notify
 
         self.notification_hook = get_notification_hook()
 
+        # Possible approvers only depend on the requested group, so cache them for
+        # when many pending access requests to the same group are approved at once
+        self.approvers_by_group_id: Dict[str, Set[OktaUser]] = {}
+
     def execute(self) -> OktaGroup:
         # Run asychronously to parallelize Okta API requests
         return asyncio.run(self._execute())
@@ -177,30 +170,20 @@ class ModifyGroupUsers:
 
         # End group memberships and ownerships
         if len(remove_changed_members) > 0 or len(remove_changed_owners) > 0:
-            OktaUserGroupMember.query.filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            ).filter(OktaUserGroupMember.group_id == self.group.id).filter(
-                OktaUserGroupMember.is_owner.is_(False)
-            ).filter(OktaUserGroupMember.user_id.in_([m.id for m in remove_changed_members])).filter(
-                OktaUserGroupMember.role_group_map_id.is_(None)
-            ).update(
+            OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter()).filter(
+                OktaUserGroupMember.group_id == self.group.id
+            ).filter(OktaUserGroupMember.is_owner.is_(False)).filter(
+                OktaUserGroupMember.user_id.in_([m.id for m in remove_changed_members])
+            ).filter(OktaUserGroupMember.role_group_map_id.is_(None)).update(
                 {OktaUserGroupMember.ended_at: db.func.now(), OktaUserGroupMember.ended_actor_id: self.current_user_id},
                 synchronize_session="fetch",
             )
 
-            OktaUserGroupMember.query.filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            ).filter(OktaUserGroupMember.group_id == self.group.id).filter(
-                OktaUserGroupMember.is_owner.is_(True)
-            ).filter(OktaUserGroupMember.user_id.in_([m.id for m in remove_changed_owners])).filter(
-                OktaUserGroupMember.role_group_map_id.is_(None)
-            ).update(
+            OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter()).filter(
+                OktaUserGroupMember.group_id == self.group.id
+            ).filter(OktaUserGroupMember.is_owner.is_(True)).filter(
+                OktaUserGroupMember.user_id.in_([m.id for m in remove_changed_owners])
+            ).filter(OktaUserGroupMember.role_group_map_id.is_(None)).update(
                 {OktaUserGroupMember.ended_at: db.func.now(), OktaUserGroupMember.ended_actor_id: self.current_user_id},
                 synchronize_session="fetch",
             )
@@ -218,12 +201,7 @@ class ModifyGroupUsers:
                     .all()
                 )
                 role_associated_group_memberships = (
-                    OktaUserGroupMember.query.filter(
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        )
-                    )
+                    OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
                     .filter(OktaUserGroupMember.user_id.in_([m.id for m in remove_changed_members]))
                     .filter(OktaUserGroupMember.role_group_map_id.in_([m.id for m in role_associated_groups_mappings]))
                 )
@@ -245,28 +223,23 @@ class ModifyGroupUsers:
             owners_to_remove_ids = [m.id for m in self.owners_to_remove]
             removed_users_with_other_access = (
                 OktaUserGroupMember.query.with_entities(OktaUserGroupMember.user_id, OktaUserGroupMember.is_owner)
-                .filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                .filter(OktaUserGroupMember.active_filter())
                 .filter(OktaUserGroupMember.group_id == self.group.id)
                 .filter(OktaUserGroupMember.user_id.in_(members_to_remove_ids + owners_to_remove_ids))
                 .group_by(OktaUserGroupMember.user_id, OktaUserGroupMember.is_owner)
                 .all()
             )
-            removed_members_with_other_access_ids = [
+            removed_members_with_other_access_ids = {
                 m.user_id for m in removed_users_with_other_access if not m.is_owner
-            ]
-            okta_members_to_remove_ids = set(members_to_remove_ids) - set(removed_members_with_other_access_ids)
+            }
+            okta_members_to_remove_ids = set(members_to_remove_ids) - removed_members_with_other_access_ids
             if self.sync_to_okta and self.group.is_managed:
                 for member_id in okta_members_to_remove_ids:
                     # Remove user from okta group membership if the group is managed by Access
                     async_tasks.append(asyncio.create_task(okta.async_remove_user_from_group(self.group.id, member_id)))
 
-            removed_owners_with_other_access_ids = [m.user_id for m in removed_users_with_other_access if m.is_owner]
-            okta_owners_to_remove_ids = set(owners_to_remove_ids) - set(removed_owners_with_other_access_ids)
+            removed_owners_with_other_access_ids = {m.user_id for m in removed_users_with_other_access if m.is_owner}
+            okta_owners_to_remove_ids = set(owners_to_remove_ids) - removed_owners_with_other_access_ids
             if self.sync_to_okta and self.group.is_managed:
                 for owner_id in okta_owners_to_remove_ids:
                     # Remove user from okta group owners if the group is managed by Access
@@ -297,12 +270,7 @@ class ModifyGroupUsers:
                         OktaUserGroupMember.group_id,
                         OktaUserGroupMember.is_owner,
                     )
-                    .filter(
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        )
-                    )
+                    .filter(OktaUserGroupMember.active_filter())
                     .filter(OktaUserGroupMember.user_id.in_(members_to_remove_ids + owners_to_remove_ids))
                     .filter(OktaUserGroupMember.group_id.in_([r.group_id for r in role_associated_groups_mappings]))
                     .group_by(
@@ -312,15 +280,16 @@ class ModifyGroupUsers:
                     )
                     .all()
                 )
+                # Index the users with other access by group and access type, rather than scanning
+                # all of them for each role associated group
+                users_with_other_access_by_group: defaultdict[tuple[str, bool], set[str]] = defaultdict(set)
+                for m in removed_role_group_users_with_other_access:
+                    users_with_other_access_by_group[(m.group_id, m.is_owner)].add(m.user_id)
                 for role_associated_group_map in role_associated_groups_mappings:
                     if not role_associated_group_map.is_owner:
-                        removed_members_with_other_access_ids = [
-                            m.user_id
-                            for m in removed_role_group_users_with_other_access
-                            if role_associated_group_map.group_id == m.group_id and not m.is_owner
-                        ]
-                        okta_members_to_remove_ids = set(members_to_remove_ids) - set(
-                            removed_members_with_other_access_ids
+                        okta_members_to_remove_ids = (
+                            set(members_to_remove_ids)
+                            - users_with_other_access_by_group[(role_associated_group_map.group_id, False)]
                         )
                         for member_id in okta_members_to_remove_ids:
                             # Remove user from okta group members
@@ -330,13 +299,9 @@ class ModifyGroupUsers:
                                 )
                             )
                     else:
-                        removed_owners_with_other_access_ids = [
-                            m.user_id
-                            for m in removed_role_group_users_with_other_access
-                            if role_associated_group_map.group_id == m.group_id and m.is_owner
-                        ]
-                        okta_owners_to_remove_ids = set(owners_to_remove_ids) - set(
-                            removed_owners_with_other_access_ids
+                        okta_owners_to_remove_ids = (
+                            set(owners_to_remove_ids)
+                            - users_with_other_access_by_group[(role_associated_group_map.group_id, True)]
                         )
                         for owner_id in okta_owners_to_remove_ids:
                             # Remove user from okta group owners
@@ -541,7 +506,11 @@ class ModifyGroupUsers:
 
         requester = db.session.get(OktaUser, access_request.requester_user_id)
 
-        approvers = get_all_possible_request_approvers(access_request)
+        if access_request.requested_group_id not in self.approvers_by_group_id:
+            self.approvers_by_group_id[access_request.requested_group_id] = get_all_possible_request_approvers(
+                access_request
+            )
+        approvers = self.approvers_by_group_id[access_request.requested_group_id]
 
         self.notification_hook.access_request_completed(
             access_request=access_request,
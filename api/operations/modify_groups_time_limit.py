@@ -36,12 +36,7 @@ class ModifyGroupsTimeLimit:
             # Reduce all user memberships for the given groups to minimum allowed time limit
             OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id.in_([g.id for g in self.groups])).filter(
                 OktaUserGroupMember.is_owner.is_(False)
-            ).filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > membership_time_limit_from_now,
-                )
-            ).update(
+            ).filter(OktaUserGroupMember.active_filter(membership_time_limit_from_now)).update(
                 {OktaUserGroupMember.ended_at: membership_time_limit_from_now},
                 synchronize_session="fetch",
             )
@@ -73,10 +68,7 @@ class ModifyGroupsTimeLimit:
             OktaUserGroupMember.query.filter(
                 OktaUserGroupMember.role_group_map_id.in_([m.id for m in role_group_map_associations])
             ).filter(OktaUserGroupMember.is_owner.is_(False)).filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > membership_time_limit_from_now,
-                )
+                OktaUserGroupMember.active_filter(membership_time_limit_from_now)
             ).update(
                 {OktaUserGroupMember.ended_at: membership_time_limit_from_now},
                 synchronize_session="fetch",
@@ -87,12 +79,7 @@ class ModifyGroupsTimeLimit:
             # Reduce all user ownerships for the given groups to minimum allowed time limit
             OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id.in_([g.id for g in self.groups])).filter(
                 OktaUserGroupMember.is_owner.is_(True)
-            ).filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > ownership_time_limit_from_now,
-                )
-            ).update(
+            ).filter(OktaUserGroupMember.active_filter(ownership_time_limit_from_now)).update(
                 {OktaUserGroupMember.ended_at: ownership_time_limit_from_now},
                 synchronize_session="fetch",
             )
@@ -124,10 +111,7 @@ class ModifyGroupsTimeLimit:
             OktaUserGroupMember.query.filter(
                 OktaUserGroupMember.role_group_map_id.in_([m.id for m in role_group_map_associations])
             ).filter(OktaUserGroupMember.is_owner.is_(True)).filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > membership_time_limit_from_now,
-                )
+                OktaUserGroupMember.active_filter(membership_time_limit_from_now)
             ).update(
                 {OktaUserGroupMember.ended_at: membership_time_limit_from_now},
                 synchronize_session="fetch",
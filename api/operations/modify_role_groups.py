@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from datetime import UTC, datetime
 from typing import Dict, Optional
 
@@ -47,54 +48,60 @@ class ModifyRoleGroups:
 
         self.groups_added_ended_at = groups_added_ended_at
 
-        self.groups_to_add = []
-        if len(groups_to_add) > 0:
-            self.groups_to_add = (
-                OktaGroup.query.options(
+        # Look up the groups being added as members and as owners together, then split them below
+        groups_to_add_by_id = (
+            {
+                group.id: group
+                for group in OktaGroup.query.options(
                     selectinload(OktaGroup.active_group_tags).joinedload(OktaGroupTagMap.active_tag)
                 )
-                .filter(OktaGroup.id.in_(groups_to_add))
+                .filter(OktaGroup.id.in_(set(groups_to_add) | set(owner_groups_to_add)))
                 .filter(OktaGroup.is_managed.is_(True))
                 .filter(OktaGroup.deleted_at.is_(None))
                 # Don't allow Roles to be added as Groups to Roles
                 .filter(OktaGroup.type != RoleGroup.__mapper_args__["polymorphic_identity"])
                 .all()
-            )
-        self.owner_groups_to_add = []
-        if len(owner_groups_to_add) > 0:
-            self.owner_groups_to_add = (
-                OktaGroup.query.options(
-                    selectinload(OktaGroup.active_group_tags).joinedload(OktaGroupTagMap.active_tag)
+            }
+            if len(groups_to_add) + len(owner_groups_to_add) > 0
+            else {}
+        )
+        self.groups_to_add = [
+            groups_to_add_by_id[group_id]
+            for group_id in dict.fromkeys(groups_to_add)
+            if group_id in groups_to_add_by_id
+        ]
+        self.owner_groups_to_add = [
+            groups_to_add_by_id[group_id]
+            for group_id in dict.fromkeys(owner_groups_to_add)
+            if group_id in groups_to_add_by_id
+        ]
+
+        groups_to_remove_by_id = (
+            {
+                group.id: group
+                for group in OktaGroup.query.filter(
+                    OktaGroup.id.in_(set(groups_to_remove) | set(owner_groups_to_remove))
                 )
-                .filter(OktaGroup.id.in_(owner_groups_to_add))
-                .filter(OktaGroup.is_managed.is_(True))
-                .filter(OktaGroup.deleted_at.is_(None))
-                # Don't allow Roles to be added as Groups to Roles
-                .filter(OktaGroup.type != RoleGroup.__mapper_args__["polymorphic_identity"])
-                .all()
-            )
-
-        self.groups_to_remove = []
-        if len(groups_to_remove) > 0:
-            self.groups_to_remove = (
-                OktaGroup.query.filter(OktaGroup.id.in_(groups_to_remove)).filter(OktaGroup.deleted_at.is_(None)).all()
-            )
-
-        self.owner_groups_to_remove = []
-        if len(owner_groups_to_remove) > 0:
-            self.owner_groups_to_remove = (
-                OktaGroup.query.filter(OktaGroup.id.in_(owner_groups_to_remove))
                 .filter(OktaGroup.deleted_at.is_(None))
                 .all()
-            )
+            }
+            if len(groups_to_remove) + len(owner_groups_to_remove) > 0
+            else {}
+        )
+        self.groups_to_remove = [
+            groups_to_remove_by_id[group_id]
+            for group_id in dict.fromkeys(groups_to_remove)
+            if group_id in groups_to_remove_by_id
+        ]
+        self.owner_groups_to_remove = [
+            groups_to_remove_by_id[group_id]
+            for group_id in dict.fromkeys(owner_groups_to_remove)
+            if group_id in groups_to_remove_by_id
+        ]
 
         self.sync_to_okta = sync_to_okta
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
         self.created_reason = created_reason
 
@@ -181,12 +188,7 @@ class ModifyRoleGroups:
             # which allow group access for this user
 
             active_role_members = (
-                OktaUserGroupMember.query.filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
                 .filter(OktaUserGroupMember.group_id == self.role.id)
                 .filter(OktaUserGroupMember.is_owner.is_(False))
             )
@@ -200,12 +202,7 @@ class ModifyRoleGroups:
                     OktaUserGroupMember.group_id,
                     OktaUserGroupMember.is_owner,
                 )
-                .filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                .filter(OktaUserGroupMember.active_filter())
                 .filter(OktaUserGroupMember.user_id.in_(role_members_to_remove_ids))
                 .filter(OktaUserGroupMember.group_id.in_(groups_to_remove_ids + owner_groups_to_remove_ids))
                 .group_by(
@@ -217,28 +214,21 @@ class ModifyRoleGroups:
             )
 
             if self.sync_to_okta:
+                users_with_other_access_by_group: defaultdict[tuple[str, bool], set[str]] = defaultdict(set)
+                for m in removed_role_group_users_with_other_access:
+                    users_with_other_access_by_group[(m.group_id, m.is_owner)].add(m.user_id)
+
                 for group_id in groups_to_remove_ids:
-                    removed_members_with_other_access_ids = [
-                        m.user_id
-                        for m in removed_role_group_users_with_other_access
-                        if group_id == m.group_id and not m.is_owner
-                    ]
-                    okta_members_to_remove_ids = set(role_members_to_remove_ids) - set(
-                        removed_members_with_other_access_ids
+                    okta_members_to_remove_ids = (
+                        set(role_members_to_remove_ids) - users_with_other_access_by_group[(group_id, False)]
                     )
                     for member_id in okta_members_to_remove_ids:
                         # Remove user from okta group members
                         async_tasks.append(asyncio.create_task(okta.async_remove_user_from_group(group_id, member_id)))
 
-            if self.sync_to_okta:
                 for group_id in owner_groups_to_remove_ids:
-                    removed_owners_with_other_access_ids = [
-                        m.user_id
-                        for m in removed_role_group_users_with_other_access
-                        if group_id == m.group_id and m.is_owner
-                    ]
-                    okta_owners_to_remove_ids = set(role_members_to_remove_ids) - set(
-                        removed_owners_with_other_access_ids
+                    okta_owners_to_remove_ids = (
+                        set(role_members_to_remove_ids) - users_with_other_access_by_group[(group_id, True)]
                     )
                     for owner_id in okta_owners_to_remove_ids:
                         # Remove user from okta group owners
@@ -297,12 +287,7 @@ class ModifyRoleGroups:
             # Group members of a role should be added as members to all newly added groups
             # and owner groups associated with that role
             active_role_memberships = (
-                OktaUserGroupMember.query.filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
                 .filter(OktaUserGroupMember.group_id == self.role.id)
                 .filter(OktaUserGroupMember.is_owner.is_(False))
                 .all()
@@ -446,12 +431,9 @@ class ModifyRoleGroups:
         )
 
         # End group memberships via role
-        OktaUserGroupMember.query.filter(
-            db.or_(
-                OktaUserGroupMember.ended_at.is_(None),
-                OktaUserGroupMember.ended_at > db.func.now(),
-            )
-        ).filter(OktaUserGroupMember.role_group_map_id.in_([m.id for m in old_role_associated_groups_mappings])).update(
+        OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter()).filter(
+            OktaUserGroupMember.role_group_map_id.in_([m.id for m in old_role_associated_groups_mappings])
+        ).update(
             {OktaUserGroupMember.ended_at: db.func.now(), OktaUserGroupMember.ended_actor_id: self.current_user_id},
             synchronize_session="fetch",
         )
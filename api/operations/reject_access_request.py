@@ -29,11 +29,7 @@ class RejectAccessRequest:
         if current_user_id is None:
             self.rejecter_id = None
         elif isinstance(current_user_id, str):
-            self.rejecter_id = getattr(
-                OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-                "id",
-                None,
-            )
+            self.rejecter_id = OktaUser.get_active_user_id(current_user_id)
         else:
             self.rejecter_id = current_user_id.id
 
@@ -29,11 +29,7 @@ class UnmanageGroup:
             .first()
         )
 
-        self.current_user_id = getattr(
-            OktaUser.query.filter(OktaUser.deleted_at.is_(None)).filter(OktaUser.id == current_user_id).first(),
-            "id",
-            None,
-        )
+        self.current_user_id = OktaUser.get_active_user_id(current_user_id)
 
     def execute(self, dry_run: bool = False) -> None:
         if self.group.is_managed:
@@ -43,12 +39,7 @@ class UnmanageGroup:
 
         # End all group memberships and ownerships via a role (not direct memberships or ownerships)
         active_access_via_roles_query = (
-            OktaUserGroupMember.query.filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
+            OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
             .filter(OktaUserGroupMember.group_id == self.group.id)
             .filter(OktaUserGroupMember.role_group_map_id.isnot(None))
         )
@@ -61,7 +61,7 @@ def get_conditional_access_hook() -> pluggy.HookRelay:
     pm.register(sys.modules[__name__])
 
     count = pm.load_setuptools_entrypoints(conditional_access_plugin_name)
-    print(f"Count of loaded conditional access plugins: {count}")
+    logger.info(f"Count of loaded conditional access plugins: {count}")
     _cached_conditional_access_hook = pm.hook
 
     return _cached_conditional_access_hook
@@ -125,7 +125,7 @@ def get_notification_hook() -> pluggy.HookRelay:
     pm.register(sys.modules[__name__])
 
     count = pm.load_setuptools_entrypoints(notification_plugin_name)
-    print(f"Count of loaded notification plugins: {count}")
+    logger.info(f"Count of loaded notification plugins: {count}")
     _cached_notification_hook = pm.hook
 
     return _cached_notification_hook
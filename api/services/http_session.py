@@ -0,0 +1,37 @@
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Status codes of external API responses worth retrying
+RETRIABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# (connect, read) timeout in seconds for external HTTP requests made while handling a request,
+# so a slow or hung upstream can't tie up a web worker
+HTTP_REQUEST_TIMEOUT = (3.05, 10)
+HTTP_RETRY_BACKOFF_FACTOR = 0.2
+
+
+def create_http_session(headers: Optional[dict[str, str]] = None, max_retries: int = 0) -> requests.Session:
+    """Returns a pooled requests session, which keeps TCP and TLS connections alive between requests"""
+    session = requests.Session()
+    if headers is not None:
+        session.headers.update(headers)
+
+    if max_retries > 0:
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=max_retries,
+                    # Don't retry after a read timeout, so HTTP_REQUEST_TIMEOUT bounds the request latency
+                    read=0,
+                    backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRIABLE_STATUS_CODES,
+                    # Don't sleep for an unbounded Retry-After while handling a request
+                    respect_retry_after_header=False,
+                )
+            ),
+        )
+    return session
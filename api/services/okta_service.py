@@ -13,9 +13,9 @@ from okta.models.user import User as OktaUserType
 from okta.models.user_schema import UserSchema as OktaUserSchemaType
 
 from api.models import OktaGroup, OktaUser
+from api.services.http_session import RETRIABLE_STATUS_CODES
 
 REQUEST_MAX_RETRIES = 3
-RETRIABLE_STATUS_CODES = [429, 500, 502, 503, 504]
 HTTP_TOO_MANY_REQUESTS = 429
 RATE_LIMIT_RESET_HEADER = "X-Rate-Limit-Reset"
 RETRY_BACKOFF_FACTOR = 0.5
@@ -93,22 +93,22 @@ class OktaService:
 
         return User(user)
 
-    def get_user_schema(self, userTypeId: str) -> UserSchema:
-        async def _get_user_schema(userTypeId: str) -> UserSchema:
-            userType, _, error = await OktaService._retry(self.okta_client.get_user_type, userTypeId)
+    async def async_get_user_schema(self, userTypeId: str) -> UserSchema:
+        userType, _, error = await OktaService._retry(self.okta_client.get_user_type, userTypeId)
 
-            if error is not None:
-                raise Exception(error)
-            assert userType is not None
+        if error is not None:
+            raise Exception(error)
+        assert userType is not None
 
-            schemaId = userType.links["schema"]["href"].rsplit("/", 1).pop()
+        schemaId = userType.links["schema"]["href"].rsplit("/", 1).pop()
 
-            schema, _, error = await OktaService._retry(self.okta_client.get_user_schema, schemaId)
-            if error is not None:
-                raise Exception(error)
-            return UserSchema(schema)
+        schema, _, error = await OktaService._retry(self.okta_client.get_user_schema, schemaId)
+        if error is not None:
+            raise Exception(error)
+        return UserSchema(schema)
 
-        return asyncio.run(_get_user_schema(userTypeId))
+    def get_user_schema(self, userTypeId: str) -> UserSchema:
+        return asyncio.run(self.async_get_user_schema(userTypeId))
 
     def list_users(self) -> list[User]:
         async def _list_users() -> list[User]:
@@ -239,7 +239,12 @@ class OktaService:
                     group_ids_with_group_rules.setdefault(id, []).append(group_rule)
         return group_ids_with_group_rules
 
-    def list_group_rules(self, *, query_params: dict[str, str] = {}) -> list[OktaGroupRuleType]:
+    # Okta returns 50 group rules per page by default, request the maximum page size instead
+    DEFAULT_GROUP_RULES_QUERY_PARAMS = {"limit": "200"}
+
+    def list_group_rules(
+        self, *, query_params: dict[str, str] = DEFAULT_GROUP_RULES_QUERY_PARAMS
+    ) -> list[OktaGroupRuleType]:
         async def _list_group_rules(query_params: dict[str, str]) -> list[OktaGroupRuleType]:
             group_rules, resp, error = await OktaService._retry(
                 self.okta_client.list_group_rules, query_params=query_params
@@ -257,20 +262,20 @@ class OktaService:
 
         return asyncio.run(_list_group_rules(query_params))
 
-    def list_users_for_group(self, groupId: str) -> list[User]:
-        async def _list_users_for_group(groupId: str) -> list[User]:
-            users, resp, error = await OktaService._retry(self.okta_client.list_group_users, groupId)
+    async def async_list_users_for_group(self, groupId: str) -> list[User]:
+        users, resp, error = await OktaService._retry(self.okta_client.list_group_users, groupId)
 
-            if error is not None:
-                raise Exception(error)
-            assert users is not None and resp is not None
+        if error is not None:
+            raise Exception(error)
+        assert users is not None and resp is not None
 
-            while resp.has_next():
-                more_users, _ = await OktaService._retry(resp.next)
-                users.extend(more_users)
-            return list(map(lambda user: User(user), users))
+        while resp.has_next():
+            more_users, _ = await OktaService._retry(resp.next)
+            users.extend(more_users)
+        return list(map(lambda user: User(user), users))
 
-        return asyncio.run(_list_users_for_group(groupId))
+    def list_users_for_group(self, groupId: str) -> list[User]:
+        return asyncio.run(self.async_list_users_for_group(groupId))
 
     async def async_delete_group(self, groupId: str) -> None:
         _, error = await OktaService._retry(self.okta_client.delete_group, groupId)
@@ -356,38 +361,38 @@ class OktaService:
 
     # https://developer.okta.com/docs/api/openapi/okta-management/management/tag/Group/#tag/Group/operation/listGroupOwners
     def list_owners_for_group(self, groupId: str) -> list[User]:
+        return asyncio.run(self.async_list_owners_for_group(groupId))
+
+    async def async_list_owners_for_group(self, groupId: str) -> list[User]:
         if groupId is None or groupId == "":
             logger.warning(f"cannot to list owners for groupId of {groupId}")
             return []
         if not self.use_group_owners_api:
             return []
 
-        async def _list_owners_for_group(groupId: str) -> list[User]:
-            request_executor = self.okta_client.get_request_executor()
-
-            request, error = await request_executor.create_request(
-                method="GET",
-                url="/api/v1/groups/{groupId}/owners".format(groupId=groupId),
-                body={},
-                headers={},
-                oauth=False,
-            )
+        request_executor = self.okta_client.get_request_executor()
 
-            if error is not None:
-                raise Exception(error)
+        request, error = await request_executor.create_request(
+            method="GET",
+            url="/api/v1/groups/{groupId}/owners".format(groupId=groupId),
+            body={},
+            headers={},
+            oauth=False,
+        )
 
-            response, error = await OktaService._retry(request_executor.execute, request, OktaUserType)
+        if error is not None:
+            raise Exception(error)
 
-            if error is not None:
-                raise Exception(error)
-            assert response is not None
+        response, error = await OktaService._retry(request_executor.execute, request, OktaUserType)
 
-            result = []
-            for user in response.get_body():
-                result.append(User(OktaUserType(user)))
-            return result
+        if error is not None:
+            raise Exception(error)
+        assert response is not None
 
-        return asyncio.run(_list_owners_for_group(groupId))
+        result = []
+        for user in response.get_body():
+            result.append(User(OktaUserType(user)))
+        return result
 
 
 # Wrapper class for the Okta API user model
@@ -417,7 +422,7 @@ class User:
         return okta_user
 
     def _convert_profile_keys_to_titles(self, user_attrs_to_titles: dict[str, str]) -> dict[str, str]:
-        return dict(((user_attrs_to_titles.get(k, k), v) for (k, v) in self.user.profile.__dict__.items()))
+        return {user_attrs_to_titles.get(k, k): v for (k, v) in self.user.profile.__dict__.items()}
 
     def get_deleted_at(self) -> Optional[datetime]:
         return (
@@ -447,16 +452,11 @@ class UserSchema:
         return tokens[0].lower() + "".join(x.title() for x in tokens[1:])
 
     def user_attrs_to_titles(self) -> dict[str, str]:
-        user_attributes_to_titles = dict(
-            (UserSchema._to_camel_case(k), v.title)
-            for (k, v) in self.schema.definitions.base.properties.__dict__.items()
-        )
-        user_attributes_to_titles.update(
-            dict(
-                (UserSchema._to_camel_case(k), v["title"])
-                for (k, v) in self.schema.definitions.custom.properties.items()
-            )
-        )
+        user_attributes_to_titles = {
+            UserSchema._to_camel_case(k): v.title for (k, v) in self.schema.definitions.base.properties.__dict__.items()
+        }
+        for k, v in self.schema.definitions.custom.properties.items():
+            user_attributes_to_titles[UserSchema._to_camel_case(k)] = v["title"]
         return user_attributes_to_titles
 
 
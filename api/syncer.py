@@ -1,13 +1,14 @@
+import asyncio
 import logging
 from collections import defaultdict
 from datetime import date, datetime, timedelta, timezone
-from typing import List
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Optional
 
 from flask import current_app
+from okta.models.group_rule import GroupRule as OktaGroupRuleType
 from sqlalchemy.orm import (
     aliased,
     joinedload,
-    selectinload,
     with_polymorphic,
 )
 
@@ -15,7 +16,6 @@ from api.extensions import db
 from api.models import (
     AccessRequest,
     AccessRequestStatus,
-    App,
     AppGroup,
     OktaGroup,
     OktaUser,
@@ -24,7 +24,7 @@ from api.models import (
     RoleGroupMap,
 )
 from api.models.app_group import get_access_owners, get_app_managers
-from api.models.okta_group import get_group_managers
+from api.models.okta_group import get_group_managers_by_group_id
 from api.operations import (
     DeleteGroup,
     DeleteUser,
@@ -34,17 +34,84 @@ from api.operations import (
 )
 from api.plugins import get_notification_hook
 from api.services import okta
-from api.services.okta_service import is_managed_group
+from api.services.okta_service import Group, User, is_managed_group
+
+# Maximum number of concurrent Okta API requests made while syncing
+OKTA_SYNC_MAX_WORKERS = 8
+# Number of groups whose members or owners are listed from Okta before they are synced
+OKTA_SYNC_GROUPS_CHUNK_SIZE = 50
+# Maximum number of users added to a group by a single ModifyGroupUsers operation while syncing,
+# which bounds both its query bind parameters and its concurrent Okta requests
+MODIFY_GROUP_USERS_BATCH_SIZE = 100
 
 logger = logging.getLogger(__name__)
 
 
+def _list_for_groups(
+    list_for_group: Callable[[str], Coroutine[Any, Any, list[User]]], groups: list[Group], stale_group_ids: set[str]
+) -> Iterator[tuple[Group, list[User]]]:
+    """Yields each group with its users listed from Okta, listing a chunk of groups concurrently at a time.
+    Groups added to stale_group_ids while the groups before them are synced are listed again when yielded."""
+
+    async def _list_for_groups_chunk(groups_chunk: list[Group]) -> list[list[User]]:
+        semaphore = asyncio.Semaphore(OKTA_SYNC_MAX_WORKERS)
+
+        async def _list_for_group(group: Group) -> list[User]:
+            async with semaphore:
+                return await list_for_group(group.id)
+
+        return await asyncio.gather(*(_list_for_group(group) for group in groups_chunk))
+
+    # Only list the next chunk once the groups before it have been synced, so that at most one chunk
+    # of Okta users is held in memory and the groups before a failed request are already synced
+    for i in range(0, len(groups), OKTA_SYNC_GROUPS_CHUNK_SIZE):
+        groups_chunk = groups[i : i + OKTA_SYNC_GROUPS_CHUNK_SIZE]
+        users_chunk = asyncio.run(_list_for_groups_chunk(groups_chunk))
+        # Changes made before the chunk was listed are already reflected in it
+        stale_group_ids.clear()
+        for group, users in zip(groups_chunk, users_chunk):
+            # Syncing an earlier group in the chunk changed this group in Okta, ie. an earlier role group's
+            # members were removed from its associated groups, so its chunk listing is out of date
+            if group.id in stale_group_ids:
+                users = asyncio.run(list_for_group(group.id))
+            yield group, users
+
+
+def _get_role_associated_group_ids(role_group_id: str) -> set[str]:
+    """Returns the IDs of the groups whose members or owners in Okta change with the given role group's users"""
+    return {
+        row.group_id
+        for row in db.session.query(RoleGroupMap.group_id)
+        .filter(
+            db.or_(
+                RoleGroupMap.ended_at.is_(None),
+                RoleGroupMap.ended_at > db.func.now(),
+            )
+        )
+        .filter(RoleGroupMap.role_group_id == role_group_id)
+    }
+
+
+async def _get_user_attrs_to_titles(user_type_ids: list[str]) -> list[dict[str, str]]:
+    """Returns the user attribute titles of each user type, fetching their schemas from Okta concurrently"""
+    semaphore = asyncio.Semaphore(OKTA_SYNC_MAX_WORKERS)
+
+    async def _get_user_type_attrs_to_titles(user_type_id: str) -> dict[str, str]:
+        async with semaphore:
+            return (await okta.async_get_user_schema(user_type_id)).user_attrs_to_titles()
+
+    return await asyncio.gather(*(_get_user_type_attrs_to_titles(user_type_id) for user_type_id in user_type_ids))
+
+
 def sync_users() -> None:
     logger.info("User sync starting")
 
     # Get all users from okta
     users = okta.list_users()
-    user_type_to_user_attrs_to_titles = {}
+
+    # Fetch the schema of each distinct user type concurrently up front
+    user_type_ids = list({user.type.id for user in users})
+    user_type_to_user_attrs_to_titles = dict(zip(user_type_ids, asyncio.run(_get_user_attrs_to_titles(user_type_ids))))
 
     # Hydrate all users into sql alchemy context at once
     # to avoid a roundtrip for each user
@@ -53,9 +120,6 @@ def sync_users() -> None:
     for user in users:
         logger.info(f"Syncing user {user.id}")
 
-        if user.type.id not in user_type_to_user_attrs_to_titles:
-            user_type_to_user_attrs_to_titles[user.type.id] = okta.get_user_schema(user.type.id).user_attrs_to_titles()
-
         user_attrs_to_titles = user_type_to_user_attrs_to_titles[user.type.id]
 
         db_user = db.session.get(OktaUser, user.id)
@@ -70,9 +134,17 @@ def sync_users() -> None:
 
     db.session.commit()
 
-    # Delete users and end all group memberships in the DB for users that are suspended/deactivated in Okta
-    deleted_user_ids = [u.id for u in filter(lambda u: u.get_deleted_at() is not None, users)]
+    # Split the Okta users into suspended/deactivated and active users in a single pass,
+    # as get_deleted_at parses the status change timestamp
+    deleted_user_ids = []
+    active_user_ids = []
+    for user in users:
+        if user.get_deleted_at() is not None:
+            deleted_user_ids.append(user.id)
+        else:
+            active_user_ids.append(user.id)
 
+    # Delete users and end all group memberships in the DB for users that are suspended/deactivated in Okta
     users_to_delete = (
         OktaUser.query.filter(OktaUser.id.in_(deleted_user_ids)).filter(OktaUser.deleted_at.is_(None)).all()
     )
@@ -82,8 +154,6 @@ def sync_users() -> None:
         DeleteUser(user=user.id).execute()
 
     # Delete users and end all group memberships in the DB for users that are deleted in Okta
-    active_user_ids = [u.id for u in filter(lambda u: u.get_deleted_at() is None, users)]
-
     more_users_to_delete = (
         OktaUser.query.filter(OktaUser.id.not_in(active_user_ids)).filter(OktaUser.deleted_at.is_(None)).all()
     )
@@ -93,16 +163,22 @@ def sync_users() -> None:
         DeleteUser(user=user.id, sync_to_okta=False).execute()
 
     # End all active group memberships in the DB for users that were previously deleted
-    db_deleted_users_with_access = (
-        OktaUserGroupMember.query.join(OktaUserGroupMember.user)
+    db_deleted_user_ids_with_access = (
+        db.session.query(OktaUserGroupMember.user_id)
+        .join(OktaUserGroupMember.user)
         .filter(OktaUser.deleted_at.isnot(None))
-        .filter(db.or_(OktaUserGroupMember.ended_at.is_(None), OktaUserGroupMember.ended_at > db.func.now()))
+        .filter(OktaUserGroupMember.active_filter())
+        .distinct()
         .all()
     )
-    for user_id in set([u.user_id for u in db_deleted_users_with_access]):
+    for (user_id,) in db_deleted_user_ids_with_access:
         logger.info(f"Ending active group ownerships/memberships for deleted user in DB {user_id}")
         DeleteUser(user=user_id).execute()
 
+    # Rehydrate all users into sql alchemy context at once, as the commits above
+    # expired them, to avoid a roundtrip for each user when syncing managers
+    _ = OktaUser.query.all()
+
     # Sync manager foreign keys, as Okta only gives us employee numbers
     users_by_employee_number = {
         user.profile.employee_number: user for user in filter(lambda u: u.profile.employee_number is not None, users)
@@ -117,13 +193,17 @@ def sync_users() -> None:
     logger.info("User sync finished.")
 
 
-def sync_groups(act_as_authority: bool) -> None:
+def sync_groups(
+    act_as_authority: bool,
+    group_ids_with_group_rules: Optional[dict[str, list[OktaGroupRuleType]]] = None,
+) -> None:
     logger.info("Group sync starting")
 
     groups_in_okta = okta.list_groups()
     db_group_ids = {row.id for row in db.session.query(OktaGroup.id).filter(OktaGroup.deleted_at.is_(None)).all()}
 
-    group_ids_with_group_rules = okta.list_groups_with_active_rules()
+    if group_ids_with_group_rules is None:
+        group_ids_with_group_rules = okta.list_groups_with_active_rules()
 
     for group in groups_in_okta:
         logger.info(f"Syncing group {group.id}")
@@ -173,189 +253,198 @@ def sync_groups(act_as_authority: bool) -> None:
     logger.info("Group sync finished.")
 
 
-def sync_group_memberships(act_as_authority: bool) -> None:
+def sync_group_memberships(
+    act_as_authority: bool,
+    groups: Optional[list[Group]] = None,
+    group_ids_with_group_rules: Optional[dict[str, list[OktaGroupRuleType]]] = None,
+) -> None:
     logger.info("Membership sync started.")
-    groups = okta.list_groups()
+    if groups is None:
+        groups = okta.list_groups()
 
     # Hydrate all groups into sql alchemy context at once
     # to avoid a roundtrip for each group
     _ = db.session.query(with_polymorphic(OktaGroup, [AppGroup, RoleGroup])).all()
 
-    group_ids_with_group_rules = okta.list_groups_with_active_rules()
+    if group_ids_with_group_rules is None:
+        group_ids_with_group_rules = okta.list_groups_with_active_rules()
 
-    for group in groups:
+    # Groups whose Okta members were changed while syncing an earlier group
+    stale_group_ids: set[str] = set()
+    for group, members in _list_for_groups(okta.async_list_users_for_group, groups, stale_group_ids):
         is_managed = is_managed_group(group, group_ids_with_group_rules)
 
         act_authoritatively = act_as_authority and is_managed
 
         logger.info(f"Syncing group {group.id}. act_authoritatively: {act_authoritatively}")
 
-        members = okta.list_users_for_group(group.id)
-
-        logger.info(f"Fetched users list for group {group.id}")
-
-        db_all_group_members = {
-            row.id: row.user_id
-            for row in db.session.query(
-                OktaUserGroupMember.user_id,
-                OktaUserGroupMember.id,
-            ).filter(
+        # Distinct user IDs with an active membership in the DB, a user may have several
+        # memberships to the same group (ie. directly and via a role)
+        db_all_group_member_ids = {
+            row.user_id
+            for row in db.session.query(OktaUserGroupMember.user_id).filter(
                 OktaUserGroupMember.group_id == group.id,
                 OktaUserGroupMember.is_owner.is_(False),
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                ),
+                OktaUserGroupMember.active_filter(),
             )
         }
 
+        members_to_add = []
         for member in members:
             # User is a member in okta but not in the DB
-            if member.id not in db_all_group_members.values():
+            if member.id not in db_all_group_member_ids:
                 logger.info(f"User {member.id} is not in the group in our DB.")
 
                 if act_authoritatively:
                     okta.remove_user_from_group(group.id, member.id)
                 else:
-                    reason = (
-                        "User in Okta group but not in Access group."
-                        if is_managed
-                        else "User added via Okta group rule."
-                    )
-                    ModifyGroupUsers(
-                        group=group.id,
-                        members_to_add=[member.id],
-                        created_reason=reason,
-                    ).execute()
+                    members_to_add.append(member.id)
 
             # User is a member in okta and an entry exists in our DB
             else:
-                db_all_group_members = {k: v for k, v in db_all_group_members.items() if v != member.id}
+                db_all_group_member_ids.discard(member.id)
+
+        # Add the members missing from the DB in batches, rather than one operation per user
+        reason = "User in Okta group but not in Access group." if is_managed else "User added via Okta group rule."
+        for i in range(0, len(members_to_add), MODIFY_GROUP_USERS_BATCH_SIZE):
+            ModifyGroupUsers(
+                group=group.id,
+                members_to_add=members_to_add[i : i + MODIFY_GROUP_USERS_BATCH_SIZE],
+                created_reason=reason,
+            ).execute()
 
         logger.info("Members in Okta synced to DB.")
 
         # All remaining values are memberships that are marked active in our DB
         # But are not valid memberships in okta
-        if db_all_group_members:
+        if db_all_group_member_ids:
             logger.info(
-                f"Users were marked as members in the DB but not in okta. Updating. User IDs: {db_all_group_members}"
+                f"Users were marked as members in the DB but not in okta. Updating. User IDs: {db_all_group_member_ids}"
             )
 
-            distinct_member_ids = set(db_all_group_members.values())
             if act_authoritatively:
                 # Create in okta
-                for member_id in distinct_member_ids:
+                for member_id in db_all_group_member_ids:
                     okta.add_user_to_group(group.id, member_id)
             else:
                 # Remove the direct group memberships to this group in our DB
                 # This will not affect group memberships that are via other group roles
-                ModifyGroupUsers(group=group.id, members_to_remove=list(distinct_member_ids)).execute()
+                ModifyGroupUsers(group=group.id, members_to_remove=list(db_all_group_member_ids)).execute()
 
         logger.info("Members in DB synced to Okta.")
 
+        # Modifying a role group's members also changes the members of its associated groups in Okta
+        if members_to_add or (db_all_group_member_ids and not act_authoritatively):
+            stale_group_ids.update(_get_role_associated_group_ids(group.id))
+
         db.session.commit()
 
     logger.info("Membership sync finished.")
 
 
-def sync_group_ownerships(act_as_authority: bool) -> None:
+def sync_group_ownerships(
+    act_as_authority: bool,
+    groups: Optional[list[Group]] = None,
+    group_ids_with_group_rules: Optional[dict[str, list[OktaGroupRuleType]]] = None,
+) -> None:
     logger.info("Ownership sync started.")
-    groups = okta.list_groups()
+    if groups is None:
+        groups = okta.list_groups()
 
-    group_ids_with_group_rules = okta.list_groups_with_active_rules()
+    if group_ids_with_group_rules is None:
+        group_ids_with_group_rules = okta.list_groups_with_active_rules()
 
-    for group in groups:
+    # Groups whose Okta owners were changed while syncing an earlier group
+    stale_group_ids: set[str] = set()
+    for group, owners in _list_for_groups(okta.async_list_owners_for_group, groups, stale_group_ids):
         is_managed = is_managed_group(group, group_ids_with_group_rules)
 
         act_authoritatively = act_as_authority and is_managed
 
         logger.info(f"Syncing group {group.id}. act_authoritatively: {act_authoritatively}")
 
-        owners = okta.list_owners_for_group(group.id)
-
-        db_all_group_owners = {
-            row.id: row.user_id
-            for row in db.session.query(
-                OktaUserGroupMember.user_id,
-                OktaUserGroupMember.id,
-            ).filter(
+        # Distinct user IDs with an active ownership in the DB, a user may have several
+        # ownerships of the same group (ie. directly and via a role)
+        db_all_group_owner_ids = {
+            row.user_id
+            for row in db.session.query(OktaUserGroupMember.user_id).filter(
                 OktaUserGroupMember.group_id == group.id,
                 OktaUserGroupMember.is_owner.is_(True),
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                ),
+                OktaUserGroupMember.active_filter(),
             )
         }
 
         # If the group ownership is managed by Access and there are no owners for it
         # check to see if it's an AppGroup and if so, add the app owners as owners in Okta
-        if act_authoritatively and len(db_all_group_owners) == 0:
+        if act_authoritatively and len(db_all_group_owner_ids) == 0:
+            # Only the app id is needed, so don't load the app group, app and its owner groups
             app_group = (
-                AppGroup.query.options(
-                    joinedload(AppGroup.app).options(selectinload(App.active_owner_app_groups)),
-                )
+                db.session.query(AppGroup.app_id, AppGroup.is_owner)
                 .filter(AppGroup.deleted_at.is_(None))
                 .filter(AppGroup.id == group.id)
                 .first()
             )
 
             if app_group is not None and not app_group.is_owner:
-                app_owner_group_ids = [g.id for g in app_group.app.active_owner_app_groups]
-                db_all_group_owners = {
-                    row.id: row.user_id
-                    for row in db.session.query(
-                        OktaUserGroupMember.user_id,
-                        OktaUserGroupMember.id,
-                    ).filter(
+                app_owner_group_ids = (
+                    db.session.query(AppGroup.id)
+                    .filter(AppGroup.deleted_at.is_(None))
+                    .filter(AppGroup.app_id == app_group.app_id)
+                    .filter(AppGroup.is_owner.is_(True))
+                    .scalar_subquery()
+                )
+                db_all_group_owner_ids = {
+                    row.user_id
+                    for row in db.session.query(OktaUserGroupMember.user_id).filter(
                         OktaUserGroupMember.group_id.in_(app_owner_group_ids),
                         OktaUserGroupMember.is_owner.is_(True),
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        ),
+                        OktaUserGroupMember.active_filter(),
                     )
                 }
 
+        owners_to_add = []
         for owner in owners:
             # User is a owner in okta but not in the DB
-            if owner.id not in db_all_group_owners.values():
+            if owner.id not in db_all_group_owner_ids:
                 logger.info(f"User {owner.id} is not in the group in our DB.")
 
                 if act_authoritatively:
                     okta.remove_owner_from_group(group.id, owner.id)
                 else:
-                    reason = (
-                        "User in Okta group but not in Access group."
-                        if is_managed
-                        else "User was added via Okta group rule."
-                    )
-                    ModifyGroupUsers(
-                        group=group.id,
-                        owners_to_add=[owner.id],
-                        created_reason=reason,
-                    ).execute()
+                    owners_to_add.append(owner.id)
 
             # User is a owner in okta and an entry exists in our DB
             else:
-                db_all_group_owners = {k: v for k, v in db_all_group_owners.items() if v != owner.id}
+                db_all_group_owner_ids.discard(owner.id)
+
+        # Add the owners missing from the DB in batches, rather than one operation per user
+        reason = "User in Okta group but not in Access group." if is_managed else "User was added via Okta group rule."
+        for i in range(0, len(owners_to_add), MODIFY_GROUP_USERS_BATCH_SIZE):
+            ModifyGroupUsers(
+                group=group.id,
+                owners_to_add=owners_to_add[i : i + MODIFY_GROUP_USERS_BATCH_SIZE],
+                created_reason=reason,
+            ).execute()
 
         # All remaining values are ownerships that are marked active in our DB
         # But are not valid ownerships in okta
-        if db_all_group_owners:
+        if db_all_group_owner_ids:
             logger.info(
-                f"Users were marked as owners in the DB but not in okta. Updating. User IDs: {db_all_group_owners}"
+                f"Users were marked as owners in the DB but not in okta. Updating. User IDs: {db_all_group_owner_ids}"
             )
 
-            distinct_owner_ids = set(db_all_group_owners.values())
             if act_authoritatively:
                 # Create in okta
-                for owner_id in distinct_owner_ids:
+                for owner_id in db_all_group_owner_ids:
                     okta.add_owner_to_group(group.id, owner_id)
             else:
                 # Remove the direct group ownerships to this group in our DB
                 # This will not affect group ownerships that are via other group roles
-                ModifyGroupUsers(group=group.id, owners_to_remove=list(distinct_owner_ids)).execute()
+                ModifyGroupUsers(group=group.id, owners_to_remove=list(db_all_group_owner_ids)).execute()
+
+        # Modifying a role group's owners also changes the owners of its associated groups in Okta
+        if owners_to_add or (db_all_group_owner_ids and not act_authoritatively):
+            stale_group_ids.update(_get_role_associated_group_ids(group.id))
 
         db.session.commit()
 
@@ -518,17 +607,31 @@ def expiring_access_notifications_owner() -> None:
     for m in db_memberships_expiring_this_week:
         users_per_group[m.active_group].append(m.active_user)
 
-    access_owners = get_access_owners()
+    # Access owners are only looked up if some group has neither group nor app managers
+    access_owners: Optional[List[OktaUser]] = None
+
+    # Map of group id -> group managers, shared by the sections below as the same group
+    # often has memberships and roles expiring both this week and next week
+    group_managers: Dict[str, List[OktaUser]] = {}
+    # Map of app id -> app managers, for groups without managers of their own
+    app_managers: Dict[str, List[OktaUser]] = {}
 
     # Map of group owners -> (number of groups with expiring memberships, number of users with expiring memberships)
     owner_expiring_groups_this: defaultdict[OktaUser, GroupsAndUsers] = defaultdict(GroupsAndUsers)
+    group_managers |= get_group_managers_by_group_id(
+        group.id for group in users_per_group if group.id not in group_managers
+    )
     for group in users_per_group:
-        owners = get_group_managers(group.id)
+        owners = list(group_managers[group.id])
 
-        if len(owners) == 0:
-            owners += get_app_managers(group.app_id) if type(group) == AppGroup else []
+        if len(owners) == 0 and type(group) == AppGroup:
+            if group.app_id not in app_managers:
+                app_managers[group.app_id] = get_app_managers(group.app_id)
+            owners += app_managers[group.app_id]
 
         if len(owners) == 0:
+            if access_owners is None:
+                access_owners = get_access_owners()
             owners = access_owners
 
         for owner in owners:
@@ -559,13 +662,20 @@ def expiring_access_notifications_owner() -> None:
 
     # Map of group owners -> (number of groups with expiring memberships, number of users with expiring memberships)
     owner_expiring_groups_next: defaultdict[OktaUser, GroupsAndUsers] = defaultdict(GroupsAndUsers)
+    group_managers |= get_group_managers_by_group_id(
+        group.id for group in users_per_group if group.id not in group_managers
+    )
     for group in users_per_group:
-        owners = get_group_managers(group.id)
+        owners = list(group_managers[group.id])
 
-        if len(owners) == 0:
-            owners += get_app_managers(group.app_id) if type(group) == AppGroup else []
+        if len(owners) == 0 and type(group) == AppGroup:
+            if group.app_id not in app_managers:
+                app_managers[group.app_id] = get_app_managers(group.app_id)
+            owners += app_managers[group.app_id]
 
         if len(owners) == 0:
+            if access_owners is None:
+                access_owners = get_access_owners()
             owners = access_owners
 
         for owner in owners:
@@ -628,13 +738,20 @@ def expiring_access_notifications_owner() -> None:
 
     # Map of group owners -> (number of groups with expiring memberships, number of users with expiring memberships)
     owner_expiring_roles_this: defaultdict[OktaUser, GroupsAndUsers] = defaultdict(GroupsAndUsers)
+    group_managers |= get_group_managers_by_group_id(
+        group.id for group in roles_per_group if group.id not in group_managers
+    )
     for group in roles_per_group:
-        owners = get_group_managers(group.id)
+        owners = list(group_managers[group.id])
 
-        if len(owners) == 0:
-            owners += get_app_managers(group.app_id) if type(group) == AppGroup else []
+        if len(owners) == 0 and type(group) == AppGroup:
+            if group.app_id not in app_managers:
+                app_managers[group.app_id] = get_app_managers(group.app_id)
+            owners += app_managers[group.app_id]
 
         if len(owners) == 0:
+            if access_owners is None:
+                access_owners = get_access_owners()
             owners = access_owners
 
         for owner in owners:
@@ -662,13 +779,20 @@ def expiring_access_notifications_owner() -> None:
 
     # Map of group owners -> (number of groups with expiring memberships, number of users with expiring memberships)
     owner_expiring_roles_next: defaultdict[OktaUser, GroupsAndUsers] = defaultdict(GroupsAndUsers)
+    group_managers |= get_group_managers_by_group_id(
+        group.id for group in roles_per_group if group.id not in group_managers
+    )
     for group in roles_per_group:
-        owners = get_group_managers(group.id)
+        owners = list(group_managers[group.id])
 
-        if len(owners) == 0:
-            owners += get_app_managers(group.app_id) if type(group) == AppGroup else []
+        if len(owners) == 0 and type(group) == AppGroup:
+            if group.app_id not in app_managers:
+                app_managers[group.app_id] = get_app_managers(group.app_id)
+            owners += app_managers[group.app_id]
 
         if len(owners) == 0:
+            if access_owners is None:
+                access_owners = get_access_owners()
             owners = access_owners
 
         for owner in owners:
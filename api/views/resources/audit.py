@@ -163,12 +163,7 @@ class UserGroupAuditResource(MethodResource):
             owner_group_ownerships = (
                 OktaUserGroupMember.query.filter(OktaUserGroupMember.user_id == owner.id)
                 .filter(OktaUserGroupMember.is_owner.is_(True))
-                .filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                .filter(OktaUserGroupMember.active_filter())
             )
             app_owner_group_ownerships = (
                 owner_group_ownerships.options(joinedload(OktaUserGroupMember.group.of_type(AppGroup)))
@@ -186,12 +181,7 @@ class UserGroupAuditResource(MethodResource):
                 OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id.in_(app_groups_owned_ids))
                 .filter(OktaUserGroupMember.is_owner.is_(True))
                 .filter(OktaUserGroupMember.user_id != owner.id)
-                .filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                .filter(OktaUserGroupMember.active_filter())
             )
             app_groups_directly_owned_by_others_ids = set(
                 g.group_id
@@ -273,12 +263,7 @@ class UserGroupAuditResource(MethodResource):
 
         if "active" in search_args:
             if search_args["active"]:
-                query = query.filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                query = query.filter(OktaUserGroupMember.active_filter())
             else:
                 query = query.filter(
                     db.and_(
@@ -455,12 +440,7 @@ class GroupRoleAuditResource(MethodResource):
             owner_group_ownerships = (
                 OktaUserGroupMember.query.filter(OktaUserGroupMember.user_id == owner.id)
                 .filter(OktaUserGroupMember.is_owner.is_(True))
-                .filter(
-                    db.or_(
-                        OktaUserGroupMember.ended_at.is_(None),
-                        OktaUserGroupMember.ended_at > db.func.now(),
-                    )
-                )
+                .filter(OktaUserGroupMember.active_filter())
             )
             app_owner_group_ownerships = (
                 owner_group_ownerships.options(joinedload(OktaUserGroupMember.group.of_type(AppGroup)))
@@ -478,12 +458,7 @@ class GroupRoleAuditResource(MethodResource):
                     OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id.in_(app_groups_owned_ids))
                     .filter(OktaUserGroupMember.user_id != owner.id)
                     .filter(OktaUserGroupMember.is_owner.is_(True))
-                    .filter(
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        )
-                    )
+                    .filter(OktaUserGroupMember.active_filter())
                 )
                 app_groups_directly_owned_by_others_ids = set(
                     g.group_id
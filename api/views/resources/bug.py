@@ -1,10 +1,16 @@
 from typing import Any, Dict
 from urllib.parse import urlparse
 
-import requests
 from flask import current_app, request
 from flask_apispec import MethodResource
 
+from api.services.http_session import HTTP_REQUEST_TIMEOUT, create_http_session
+
+# Reuse a single session for proxying envelopes so the TCP and TLS connection
+# to the Sentry ingest host is kept alive between requests. Envelopes are not retried,
+# so a rate limited or unavailable ingest can't hold the request past the timeout
+_sentry_session = create_http_session(headers={"Content-Type": "application/x-sentry-envelope"})
+
 
 # See more at
 # https://docs.sentry.io/platforms/javascript/troubleshooting/#dealing-with-ad-blockers
@@ -24,10 +30,10 @@ class SentryProxyResource(MethodResource):
                 current_app.config["REACT_SENTRY_DSN"],
             )
 
-            requests.post(
+            _sentry_session.post(
                 url=f"https://{hostname}/api/{project_id}/envelope/",
                 data=new_envelope,
-                headers={"Content-Type": "application/x-sentry-envelope"},
+                timeout=HTTP_REQUEST_TIMEOUT,
             )
 
         return {}
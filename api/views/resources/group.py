@@ -262,12 +262,7 @@ class GroupMemberResource(MethodResource):
             OktaUserGroupMember.query.join(OktaUserGroupMember.active_group)
             .options(joinedload(OktaUserGroupMember.active_group))
             .with_entities(OktaUserGroupMember.user_id)
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
+            .filter(OktaUserGroupMember.active_filter())
             .filter(OktaGroup.deleted_at.is_(None))
             .filter(OktaUserGroupMember.group_id == group.id)
             .group_by(OktaUserGroupMember.user_id)
@@ -347,12 +342,7 @@ class GroupMemberResource(MethodResource):
             OktaUserGroupMember.query.join(OktaUserGroupMember.active_group)
             .options(joinedload(OktaUserGroupMember.active_group))
             .with_entities(OktaUserGroupMember.user_id)
-            .filter(
-                db.or_(
-                    OktaUserGroupMember.ended_at.is_(None),
-                    OktaUserGroupMember.ended_at > db.func.now(),
-                )
-            )
+            .filter(OktaUserGroupMember.active_filter())
             .filter(OktaGroup.deleted_at.is_(None))
             .filter(OktaUserGroupMember.group_id == group.id)
             .group_by(OktaUserGroupMember.user_id)
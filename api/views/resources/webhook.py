@@ -5,7 +5,6 @@ from flask.typing import ResponseReturnValue
 from flask_apispec import MethodResource
 from sqlalchemy.orm import joinedload
 
-from api.extensions import db
 from api.models import OktaGroup, OktaUser, OktaUserGroupMember, RoleGroup, RoleGroupMap
 from api.operations import ModifyGroupUsers
 
@@ -109,12 +108,7 @@ class OktaWebhookResource(MethodResource):
                     )
                     .filter(OktaUserGroupMember.user_id == user.id)
                     .filter(OktaUserGroupMember.group_id == group.id)
-                    .filter(
-                        db.or_(
-                            OktaUserGroupMember.ended_at.is_(None),
-                            OktaUserGroupMember.ended_at > db.func.now(),
-                        )
-                    )
+                    .filter(OktaUserGroupMember.active_filter())
                     .filter(OktaUserGroupMember.is_owner.is_(False))
                     .filter(OktaUserGroupMember.role_group_map_id.is_not(None))
                     .all()
@@ -0,0 +1,100 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from flask import Flask, request
+from pytest_mock import MockerFixture
+from werkzeug.exceptions import Forbidden
+
+from api.authentication import CloudflareAuthenticationHelpers
+
+AUDIENCE = "test-audience"
+
+
+@pytest.fixture
+def cloudflare_app(app: Flask, monkeypatch: pytest.MonkeyPatch) -> Flask:
+    cached_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    monkeypatch.setitem(app.config, "CLOUDFLARE_TEAM_DOMAIN", "example.cloudflareaccess.com")
+    monkeypatch.setitem(app.config, "CLOUDFLARE_APPLICATION_AUDIENCE", AUDIENCE)
+    monkeypatch.setitem(app.config, "CLOUDFLARE_PUBLIC_KEYS", {"cached": cached_key.public_key()})
+    monkeypatch.setitem(app.config, "CLOUDFLARE_PUBLIC_KEYS_MIN_REFRESH_SECONDS", 60)
+    monkeypatch.setitem(app.config, "CLOUDFLARE_PUBLIC_KEYS_REFETCHED_AT", None)
+    return app
+
+
+def test_unknown_kid_refetches_public_keys(cloudflare_app: Flask, mocker: MockerFixture) -> None:
+    rotated_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = jwt.encode(
+        {"email": "user@example.com", "aud": AUDIENCE}, rotated_key, algorithm="RS256", headers={"kid": "rotated"}
+    )
+    get_public_keys_spy = mocker.patch.object(
+        CloudflareAuthenticationHelpers, "get_public_keys", return_value={"rotated": rotated_key.public_key()}
+    )
+
+    with cloudflare_app.test_request_context(headers={"Cf-Access-Jwt-Assertion": token}):
+        payload = CloudflareAuthenticationHelpers.verify_cloudflare_token(request)
+
+    assert payload["email"] == "user@example.com"
+    assert get_public_keys_spy.call_count == 1
+    assert "rotated" in cloudflare_app.config["CLOUDFLARE_PUBLIC_KEYS"]
+    assert cloudflare_app.config["CLOUDFLARE_PUBLIC_KEYS_REFETCHED_AT"] is not None
+
+
+def test_unknown_kid_within_refresh_window_does_not_refetch(cloudflare_app: Flask, mocker: MockerFixture) -> None:
+    rotated_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = jwt.encode(
+        {"email": "user@example.com", "aud": AUDIENCE}, rotated_key, algorithm="RS256", headers={"kid": "rotated"}
+    )
+    get_public_keys_spy = mocker.patch.object(
+        CloudflareAuthenticationHelpers, "get_public_keys", return_value={"rotated": rotated_key.public_key()}
+    )
+    cloudflare_app.config["CLOUDFLARE_PUBLIC_KEYS_REFETCHED_AT"] = time.monotonic()
+
+    with cloudflare_app.test_request_context(headers={"Cf-Access-Jwt-Assertion": token}):
+        with pytest.raises(Forbidden):
+            CloudflareAuthenticationHelpers.verify_cloudflare_token(request)
+
+    assert get_public_keys_spy.call_count == 0
+
+
+def test_unknown_kid_after_refresh_window_refetches(cloudflare_app: Flask, mocker: MockerFixture) -> None:
+    rotated_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = jwt.encode(
+        {"email": "user@example.com", "aud": AUDIENCE}, rotated_key, algorithm="RS256", headers={"kid": "rotated"}
+    )
+    get_public_keys_spy = mocker.patch.object(
+        CloudflareAuthenticationHelpers, "get_public_keys", return_value={"rotated": rotated_key.public_key()}
+    )
+    cloudflare_app.config["CLOUDFLARE_PUBLIC_KEYS_REFETCHED_AT"] = time.monotonic() - 61
+
+    with cloudflare_app.test_request_context(headers={"Cf-Access-Jwt-Assertion": token}):
+        payload = CloudflareAuthenticationHelpers.verify_cloudflare_token(request)
+
+    assert payload["email"] == "user@example.com"
+    assert get_public_keys_spy.call_count == 1
+
+
+def test_unknown_kid_caches_refetched_public_keys(cloudflare_app: Flask, mocker: MockerFixture) -> None:
+    rotated_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    junk_token = jwt.encode(
+        {"email": "user@example.com", "aud": AUDIENCE}, rotated_key, algorithm="RS256", headers={"kid": "junk"}
+    )
+    token = jwt.encode(
+        {"email": "user@example.com", "aud": AUDIENCE}, rotated_key, algorithm="RS256", headers={"kid": "rotated"}
+    )
+    get_public_keys_spy = mocker.patch.object(
+        CloudflareAuthenticationHelpers, "get_public_keys", return_value={"rotated": rotated_key.public_key()}
+    )
+
+    with cloudflare_app.test_request_context(headers={"Cf-Access-Jwt-Assertion": junk_token}):
+        with pytest.raises(Forbidden):
+            CloudflareAuthenticationHelpers.verify_cloudflare_token(request)
+
+    # A token signed with the rotated key is verified with the key set fetched for the junk token,
+    # within the refresh window
+    with cloudflare_app.test_request_context(headers={"Cf-Access-Jwt-Assertion": token}):
+        payload = CloudflareAuthenticationHelpers.verify_cloudflare_token(request)
+
+    assert payload["email"] == "user@example.com"
+    assert get_public_keys_spy.call_count == 1
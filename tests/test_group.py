@@ -21,6 +21,7 @@ from api.models import (
     RoleGroup,
     Tag,
 )
+from api.models.okta_group import get_group_managers_by_group_id
 from api.operations import CreateAccessRequest, ModifyGroupUsers, ModifyRoleGroups
 from api.services import okta
 from tests.factories import AppGroupFactory, OktaGroupFactory, RoleGroupFactory
@@ -717,3 +718,35 @@ def test_get_all_group(client: FlaskClient, db: SQLAlchemy, access_app: App) ->
     assert len(results["results"]) == 4
     for group in app_groups:
         assert any(u["id"] == group.id for u in results["results"])
+
+
+def test_get_group_managers_by_group_id(
+    db: SQLAlchemy, okta_group: OktaGroup, role_group: RoleGroup, user: OktaUser
+) -> None:
+    other_group = OktaGroupFactory.create()
+    db.session.add(okta_group)
+    db.session.add(other_group)
+    db.session.add(role_group)
+    db.session.add(user)
+    db.session.commit()
+
+    # Make the user an owner of the group both directly and via a role
+    ModifyGroupUsers(group=okta_group, owners_to_add=[user.id], sync_to_okta=False).execute()
+    ModifyRoleGroups(role_group=role_group, owner_groups_to_add=[okta_group.id], sync_to_okta=False).execute()
+    ModifyGroupUsers(group=role_group, members_to_add=[user.id], sync_to_okta=False).execute()
+
+    assert (
+        OktaUserGroupMember.query.filter(OktaUserGroupMember.group_id == okta_group.id)
+        .filter(OktaUserGroupMember.user_id == user.id)
+        .filter(OktaUserGroupMember.is_owner.is_(True))
+        .count()
+        == 2
+    )
+
+    group_managers = get_group_managers_by_group_id([okta_group.id, other_group.id])
+
+    # Users owning a group several times are only returned once and
+    # requested groups without managers are returned with no managers
+    assert group_managers == {okta_group.id: [user], other_group.id: []}
+
+    assert get_group_managers_by_group_id([]) == {}
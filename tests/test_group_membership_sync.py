@@ -7,10 +7,11 @@ from pytest_mock import MockerFixture
 from sqlalchemy.orm import Session
 
 from api.models import OktaGroup, OktaUser, OktaUserGroupMember
+from api.operations import ModifyGroupUsers, ModifyRoleGroups
 from api.services import okta
 from api.services.okta_service import Group, User
 from api.syncer import sync_group_memberships
-from tests.factories import GroupFactory, UserFactory
+from tests.factories import GroupFactory, OktaGroupFactory, OktaUserFactory, RoleGroupFactory, UserFactory
 
 MembershipDetails = namedtuple("MembershipDetails", ["expired_at", "db_pk"])
 
@@ -301,6 +302,158 @@ def test_membership_through_multiple_groups_non_authoritative(db: SQLAlchemy, mo
     assert _get_group_membership(db, pk_2).expired_at == date_2
 
 
+def test_membership_sync_across_group_chunks(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    initial_okta_users = UserFactory.create_batch(3)
+    initial_okta_groups = GroupFactory.create_batch(3)
+    _, _ = seed_db(db, initial_okta_users, initial_okta_groups)
+
+    sync_events = []
+
+    def fake_list_users_for_group(group_id: str) -> list[User]:
+        sync_events.append(("list", group_id))
+        return initial_okta_users
+
+    modify_group_users_execute = ModifyGroupUsers.execute
+
+    def recording_execute(self: ModifyGroupUsers) -> None:
+        sync_events.append(("modify", self.group.id))
+        modify_group_users_execute(self)
+
+    mocker.patch.object(ModifyGroupUsers, "execute", autospec=True, side_effect=recording_execute)
+
+    # List the group members from Okta in chunks smaller than the number of groups
+    mocker.patch("api.syncer.OKTA_SYNC_GROUPS_CHUNK_SIZE", 2)
+
+    _ = run_sync(db, mocker, initial_okta_groups, fake_list_users_for_group, False)
+
+    # Each chunk is listed at once, and the next chunk is only listed after the previous one is synced
+    group_ids = [group.id for group in initial_okta_groups]
+    assert sync_events == [
+        ("list", group_ids[0]),
+        ("list", group_ids[1]),
+        ("modify", group_ids[0]),
+        ("modify", group_ids[1]),
+        ("list", group_ids[2]),
+        ("modify", group_ids[2]),
+    ]
+    for group in initial_okta_groups:
+        assert len(_get_group_members(db, group.id)) == 3
+
+
+def test_membership_sync_relists_role_associated_group_in_chunk(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    user = OktaUserFactory.create()
+    role_group = RoleGroupFactory.create()
+    okta_group = OktaGroupFactory.create()
+    db.session.add_all([user, role_group, okta_group])
+    db.session.commit()
+
+    ModifyRoleGroups(role_group=role_group, groups_to_add=[okta_group.id], sync_to_okta=False).execute()
+    ModifyGroupUsers(group=role_group, members_to_add=[user.id], sync_to_okta=False).execute()
+
+    # The user was removed from the role in Okta, but is still a member of the role associated group
+    okta_user = UserFactory.create()
+    okta_user.id = user.id
+    okta_role_group = GroupFactory.create()
+    okta_role_group.id = role_group.id
+    okta_associated_group = GroupFactory.create()
+    okta_associated_group.id = okta_group.id
+    okta_group_members = {okta_role_group.id: [], okta_associated_group.id: [okta_user]}
+
+    def fake_list_users_for_group(group_id: str) -> list[User]:
+        return list(okta_group_members[group_id])
+
+    def fake_remove_user_from_group(group_id: str, user_id: str) -> None:
+        okta_group_members[group_id] = [u for u in okta_group_members[group_id] if u.id != user_id]
+
+    list_users_for_group_spy = mocker.patch.object(
+        okta, "async_list_users_for_group", side_effect=fake_list_users_for_group
+    )
+    mocker.patch.object(okta, "async_remove_user_from_group", side_effect=fake_remove_user_from_group)
+
+    # The role group is synced before its associated group in the same chunk
+    sync_group_memberships(False, groups=[okta_role_group, okta_associated_group], group_ids_with_group_rules={})
+
+    # Removing the user from the role removed them from the associated group in Okta, which is listed again
+    # rather than syncing the user back into it from its chunk listing
+    assert [call.args[0] for call in list_users_for_group_spy.call_args_list] == [
+        okta_role_group.id,
+        okta_associated_group.id,
+        okta_associated_group.id,
+    ]
+    assert okta_group_members[okta_associated_group.id] == []
+    assert (
+        OktaUserGroupMember.query.filter(OktaUserGroupMember.active_filter())
+        .filter(OktaUserGroupMember.user_id == user.id)
+        .count()
+        == 0
+    )
+
+
+def test_missing_memberships_added_in_one_operation(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    initial_okta_users = UserFactory.create_batch(3)
+    initial_okta_groups = GroupFactory.create_batch(3)
+    _, _ = seed_db(db, initial_okta_users, initial_okta_groups)
+
+    def fake_list_users_for_group(group_id: str) -> list[User]:
+        if group_id == initial_okta_groups[0].id:
+            return initial_okta_users
+        return []
+
+    modify_group_users_spy = mocker.spy(ModifyGroupUsers, "execute")
+
+    _ = run_sync(db, mocker, initial_okta_groups, fake_list_users_for_group, False)
+
+    assert modify_group_users_spy.call_count == 1
+    assert len(_get_group_members(db, initial_okta_groups[0].id)) == 3
+
+
+def test_missing_memberships_added_in_batches(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    initial_okta_users = UserFactory.create_batch(3)
+    initial_okta_groups = GroupFactory.create_batch(3)
+    _, _ = seed_db(db, initial_okta_users, initial_okta_groups)
+
+    def fake_list_users_for_group(group_id: str) -> list[User]:
+        if group_id == initial_okta_groups[0].id:
+            return initial_okta_users
+        return []
+
+    mocker.patch("api.syncer.MODIFY_GROUP_USERS_BATCH_SIZE", 2)
+    modify_group_users_spy = mocker.spy(ModifyGroupUsers, "execute")
+
+    _ = run_sync(db, mocker, initial_okta_groups, fake_list_users_for_group, False)
+
+    assert modify_group_users_spy.call_count == 2
+    assert len(_get_group_members(db, initial_okta_groups[0].id)) == 3
+
+
+def test_membership_sync_with_prefetched_groups_and_rules(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    initial_okta_users = UserFactory.create_batch(3)
+    initial_okta_groups = GroupFactory.create_batch(3)
+    _, _ = seed_db(db, initial_okta_users, initial_okta_groups)
+
+    def fake_list_users_for_group(group_id: str) -> list[User]:
+        if group_id == initial_okta_groups[0].id:
+            return initial_okta_users
+        return []
+
+    list_groups_spy = mocker.patch.object(okta, "list_groups")
+    list_groups_with_active_rules_spy = mocker.patch.object(okta, "list_groups_with_active_rules")
+    mocker.patch.object(okta, "async_list_users_for_group", side_effect=fake_list_users_for_group)
+    delete_membership_spy = mocker.patch.object(okta, "remove_user_from_group")
+
+    # The first group has a group rule, so it's unmanaged and its Okta members are added to the DB
+    sync_group_memberships(
+        True,
+        groups=initial_okta_groups,
+        group_ids_with_group_rules={initial_okta_groups[0].id: []},
+    )
+
+    assert list_groups_spy.call_count == 0
+    assert list_groups_with_active_rules_spy.call_count == 0
+    assert delete_membership_spy.call_count == 0
+    assert len(_get_group_members(db, initial_okta_groups[0].id)) == 3
+
+
 def seed_db(db: SQLAlchemy, users: list[OktaUser], groups: list[OktaGroup]) -> Tuple[list[OktaUser], list[OktaGroup]]:
     with Session(db.engine) as session:
         session.add_all([Group(g).update_okta_group(OktaGroup(), {}) for g in groups])
@@ -321,7 +474,7 @@ def run_sync(
     with Session(db.engine) as session:
         mocker.patch.object(okta, "list_groups", return_value=okta_groups)
 
-        mocker.patch.object(okta, "list_users_for_group", side_effect=user_membership_func)
+        mocker.patch.object(okta, "async_list_users_for_group", side_effect=user_membership_func)
 
         mocker.patch.object(okta, "list_groups_with_active_rules", return_value=groups_with_rules)
 
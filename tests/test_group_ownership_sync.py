@@ -7,10 +7,19 @@ from pytest_mock import MockerFixture
 from sqlalchemy.orm import Session
 
 from api.models import AppGroup, OktaGroup, OktaUser, OktaUserGroupMember
+from api.operations import ModifyGroupUsers, ModifyRoleGroups
 from api.services import okta
 from api.services.okta_service import Group, User
 from api.syncer import sync_group_ownerships
-from tests.factories import AppFactory, AppGroupFactory, GroupFactory, UserFactory
+from tests.factories import (
+    AppFactory,
+    AppGroupFactory,
+    GroupFactory,
+    OktaGroupFactory,
+    OktaUserFactory,
+    RoleGroupFactory,
+    UserFactory,
+)
 
 OwnershipDetails = namedtuple("OwnershipDetails", ["expired_at", "db_pk"])
 
@@ -379,6 +388,78 @@ def test_ownership_through_multiple_groups_non_authoritative(db: SQLAlchemy, moc
     assert _get_group_ownership(db, pk_2).expired_at == date_2
 
 
+def test_ownership_sync_with_prefetched_groups_and_rules(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    initial_okta_users = UserFactory.create_batch(3)
+    initial_okta_groups = GroupFactory.build_batch(3)
+    _, _ = seed_db(db, initial_okta_users, initial_okta_groups)
+
+    def fake_list_owners_for_group(group_id: str) -> list[User]:
+        if group_id == initial_okta_groups[0].id:
+            return initial_okta_users
+        return []
+
+    list_groups_spy = mocker.patch.object(okta, "list_groups")
+    list_groups_with_active_rules_spy = mocker.patch.object(okta, "list_groups_with_active_rules")
+    mocker.patch.object(okta, "async_list_owners_for_group", side_effect=fake_list_owners_for_group)
+    delete_ownership_spy = mocker.patch.object(okta, "remove_owner_from_group")
+
+    # The first group has a group rule, so it's unmanaged and its Okta owners are added to the DB
+    sync_group_ownerships(
+        True,
+        groups=initial_okta_groups,
+        group_ids_with_group_rules={initial_okta_groups[0].id: []},
+    )
+
+    assert list_groups_spy.call_count == 0
+    assert list_groups_with_active_rules_spy.call_count == 0
+    assert delete_ownership_spy.call_count == 0
+    assert len(_get_group_owners(db, initial_okta_groups[0].id)) == 3
+
+
+def test_ownership_sync_relists_role_associated_group_in_chunk(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    user = OktaUserFactory.create()
+    role_group = RoleGroupFactory.create()
+    okta_group = OktaGroupFactory.create()
+    db.session.add_all([user, role_group, okta_group])
+    db.session.commit()
+
+    ModifyRoleGroups(role_group=role_group, owner_groups_to_add=[okta_group.id], sync_to_okta=False).execute()
+    ModifyGroupUsers(group=role_group, owners_to_add=[user.id], sync_to_okta=False).execute()
+
+    # The user was removed as a role owner in Okta, but is still an owner of the role associated group
+    okta_user = UserFactory.create()
+    okta_user.id = user.id
+    okta_role_group = GroupFactory.build()
+    okta_role_group.id = role_group.id
+    okta_associated_group = GroupFactory.build()
+    okta_associated_group.id = okta_group.id
+    okta_group_owners = {okta_role_group.id: [], okta_associated_group.id: [okta_user]}
+
+    def fake_list_owners_for_group(group_id: str) -> list[User]:
+        return list(okta_group_owners[group_id])
+
+    def fake_remove_owner_from_group(group_id: str, user_id: str) -> None:
+        okta_group_owners[group_id] = [u for u in okta_group_owners[group_id] if u.id != user_id]
+
+    list_owners_for_group_spy = mocker.patch.object(
+        okta, "async_list_owners_for_group", side_effect=fake_list_owners_for_group
+    )
+    mocker.patch.object(okta, "async_remove_owner_from_group", side_effect=fake_remove_owner_from_group)
+
+    # The role group is synced before its associated group in the same chunk
+    sync_group_ownerships(False, groups=[okta_role_group, okta_associated_group], group_ids_with_group_rules={})
+
+    # Removing the role owner removed them from the associated group owners in Okta, which are listed again
+    # rather than syncing the user back in as an owner from its chunk listing
+    assert [call.args[0] for call in list_owners_for_group_spy.call_args_list] == [
+        okta_role_group.id,
+        okta_associated_group.id,
+        okta_associated_group.id,
+    ]
+    assert okta_group_owners[okta_associated_group.id] == []
+    assert len(_get_group_owners(db, okta_associated_group.id)) == 0
+
+
 def seed_db(db: SQLAlchemy, users: list[OktaUser], groups: list[OktaGroup]) -> Tuple[list[OktaUser], list[OktaGroup]]:
     with Session(db.engine) as session:
         session.add_all([Group(g).update_okta_group(OktaGroup(), {}) for g in groups])
@@ -399,7 +480,7 @@ def run_sync(
     with Session(db.engine) as session:
         mocker.patch.object(okta, "list_groups", return_value=okta_groups)
 
-        mocker.patch.object(okta, "list_owners_for_group", side_effect=user_ownership_func)
+        mocker.patch.object(okta, "async_list_owners_for_group", side_effect=user_ownership_func)
 
         mocker.patch.object(okta, "list_groups_with_active_rules", return_value=groups_with_rules)
 
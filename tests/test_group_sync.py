@@ -162,6 +162,27 @@ def test_group_sync_externally_managed_group_in_okta(db: SQLAlchemy, mocker: Moc
     assert external_group_entry.externally_managed_data == {"Test": 'user.department equals "Test"'}
 
 
+def test_group_sync_with_prefetched_rules(db: SQLAlchemy, mocker: MockerFixture) -> None:
+    groups_in_okta = GroupFactory.create_batch(3)
+    externally_managed_group = groups_in_okta[0]
+    groups_in_okta.append(GroupFactory.create_access_owner_group())
+
+    list_groups_with_active_rules_spy = mocker.patch.object(okta, "list_groups_with_active_rules")
+    with Session(db.engine) as session:
+        mocker.patch.object(okta, "list_groups", return_value=[Group(g) for g in groups_in_okta])
+        sync_groups(False, group_ids_with_group_rules={externally_managed_group.id: []})
+        new_db_groups = session.query(OktaGroup).all()
+
+    assert list_groups_with_active_rules_spy.call_count == 0
+    external_group_entry = get_group_by_id(new_db_groups, externally_managed_group.id)
+    assert external_group_entry is not None
+    assert external_group_entry.is_managed is False
+    for group in groups_in_okta[1:]:
+        group_entry = get_group_by_id(new_db_groups, group.id)
+        assert group_entry is not None
+        assert group_entry.is_managed is True
+
+
 def seed_db(db: SQLAlchemy, groups: list[OktaGroup]) -> list[OktaGroup]:
     with Session(db.engine) as session:
         session.add_all([Group(g).update_okta_group(OktaGroup(), {}) for g in groups])
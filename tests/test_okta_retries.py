@@ -4,7 +4,8 @@ from unittest.mock import Mock
 import pytest
 from pytest_mock import MockerFixture
 
-from api.services.okta_service import REQUEST_MAX_RETRIES, RETRIABLE_STATUS_CODES, OktaService
+from api.services.http_session import RETRIABLE_STATUS_CODES
+from api.services.okta_service import REQUEST_MAX_RETRIES, OktaService
 from tests.factories import UserFactory
 
 
@@ -30,7 +31,7 @@ def mock_sleep(mocker: MockerFixture) -> Mock:
     return mocker.patch("asyncio.sleep")
 
 
-@pytest.mark.parametrize("status_code", RETRIABLE_STATUS_CODES)
+@pytest.mark.parametrize("status_code", sorted(RETRIABLE_STATUS_CODES))
 def test_retry_logic_error_response_retriable(
     mocker: MockerFixture, mock_sleep: Mock, okta_service: OktaService, status_code: int
 ) -> None:
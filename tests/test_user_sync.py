@@ -239,7 +239,7 @@ def run_sync(db: SQLAlchemy, mocker: MockerFixture, okta_users: List[User]) -> L
     schema = UserSchemaFactory.create()
     with Session(db.engine) as session:
         mocker.patch.object(okta, "list_users", return_value=[User(u) for u in okta_users])
-        mocker.patch.object(okta, "get_user_schema", return_value=UserSchema(schema))
+        mocker.patch.object(okta, "async_get_user_schema", return_value=UserSchema(schema))
         sync_users()
         return session.query(OktaUser).all()
 